@@ -1,6 +1,6 @@
 from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Callable, Dict, List, Union
 
 import docx.document
 import docx.table
@@ -10,7 +10,7 @@ from typing_extensions import Self
 from nsb_toolbox.importers import load_doc
 
 from .classes import QuestionType, TossUpBonus
-from .docx_utils import column_indexer
+from .docx_utils import table_cells
 
 
 class BaseScienceBowlQuestions:
@@ -47,9 +47,18 @@ class BaseScienceBowlQuestions:
 
         self.document = document
 
-        self._cells = self.document.tables[0]._cells
+        self._cells = table_cells(self.document.tables[0])
         self._col_count = self.document.tables[0]._column_count
 
+        # walk the table once; every column property slices this grid
+        self._cell_grid = np.empty(len(self._cells), dtype=object)
+        self._cell_grid[:] = self._cells
+        self._cell_grid = self._cell_grid.reshape(-1, self._col_count)
+
+    def _column(self, col_idx: int) -> np.ndarray:
+        """Returns the cells of a column, excluding the header row."""
+        return self._cell_grid[1:, col_idx]
+
     def save(self, path: Union[Path, str]):
         """Saves the wrapped document to path.
 
@@ -76,33 +85,16 @@ class BaseScienceBowlQuestions:
 
     @cached_property
     def tubs(self) -> np.ndarray:
-        return np.array(
-            [
-                TossUpBonus(self._cells[i].text).value
-                for i in column_indexer(0, len(self._cells), self._col_count)
-            ],
-            dtype="<U20",
-        )
+        return _parse_tubs(np.array([cell.text for cell in self._column(0)]))
 
     @cached_property
     def difficulties(self) -> np.ndarray:
-        return np.array(
-            [
-                int(self._cells[i].text or -1)
-                for i in column_indexer(3, len(self._cells), self._col_count)
-            ]
-        )
+        return _parse_difficulties(np.array([cell.text for cell in self._column(3)]))
 
     @cached_property
     def qtypes(self) -> np.ndarray:
-        return np.array(
-            [
-                QuestionType(qtype).value
-                if (qtype := self._cells[i].paragraphs[0].runs[0].text)
-                else ""
-                for i in column_indexer(2, len(self._cells), self._col_count)
-            ],
-            dtype="<U20",
+        return _parse_qtypes(
+            np.array([cell.paragraphs[0].runs[0].text for cell in self._column(2)])
         )
 
     @property
@@ -116,20 +108,14 @@ class BaseScienceBowlQuestions:
     @cached_property
     def subcategories(self) -> np.ndarray:
         return np.array(
-            [
-                self._cells[i].text
-                for i in column_indexer(12, len(self._cells), self._col_count)
-            ],
+            [cell.text for cell in self._column(12)],
             dtype="<U20",
         )
 
     @cached_property
     def writers(self) -> np.ndarray:
         return np.array(
-            [
-                self._cells[i].text
-                for i in column_indexer(8, len(self._cells), self._col_count)
-            ],
+            [cell.text for cell in self._column(8)],
             dtype="<U100",
         )
 
@@ -149,18 +135,41 @@ class BaseScienceBowlQuestions:
 
     @property
     def sets(self) -> List[docx.table._Cell]:
-        return [
-            self._cells[i] for i in column_indexer(5, len(self._cells), self._col_count)
-        ]
+        return list(self._column(5))
 
     @property
     def rounds(self) -> List[docx.table._Cell]:
-        return [
-            self._cells[i] for i in column_indexer(6, len(self._cells), self._col_count)
-        ]
+        return list(self._column(6))
 
     @property
     def qletters(self) -> List[docx.table._Cell]:
-        return [
-            self._cells[i] for i in column_indexer(7, len(self._cells), self._col_count)
-        ]
+        return list(self._column(7))
+
+
+def _map_unique(values: np.ndarray, func: Callable[[str], str]) -> np.ndarray:
+    """Applies func to each unique entry of values and broadcasts the results back
+    to the shape of values. Columns only hold a handful of distinct labels, so this
+    avoids calling func once per cell."""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    mapped = np.array([func(str(val)) for val in uniques], dtype=values.dtype)
+    return mapped[inverse.ravel()]
+
+
+def _parse_difficulties(values: np.ndarray) -> np.ndarray:
+    """Casts a string array of LODs to integers in a single pass. Blank LODs are
+    returned as -1."""
+    return np.where(values == "", "-1", values).astype(np.int32)
+
+
+def _parse_tubs(values: np.ndarray) -> np.ndarray:
+    """Maps a string array of TUB labels to TossUpBonus values."""
+    return _map_unique(values.astype("<U20"), lambda tub: TossUpBonus(tub).value)
+
+
+def _parse_qtypes(values: np.ndarray) -> np.ndarray:
+    """Maps a string array of question type labels to QuestionType values. Blank
+    labels are kept blank."""
+    return _map_unique(
+        values.astype("<U20"),
+        lambda qtype: QuestionType(qtype).value if qtype else "",
+    )
@@ -1,16 +1,29 @@
-from functools import reduce
-from typing import Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 from typing_extensions import Self
 
 import docx.table
 import docx.document
 import numpy as np
 from scipy.optimize import linear_sum_assignment
-
-
-from ._base_questions import BaseScienceBowlQuestions
+from scipy.sparse import bmat, csr_matrix
+from scipy.sparse.csgraph import (
+    connected_components,
+    min_weight_full_bipartite_matching,
+)
+
+
+from ._base_questions import (
+    BaseScienceBowlQuestions,
+    _parse_difficulties,
+    _parse_qtypes,
+    _parse_tubs,
+)
+from .docx_utils import set_cell_text
 from .yamlparsers import ParsedQuestionSpec
 
+INVALID_ASSIGNMENT_COST = 1_000_000
+
 
 class EditedQuestions(BaseScienceBowlQuestions):
     """Represents an edited set of Science Bowl questions from a single subject
@@ -40,16 +53,20 @@ class EditedQuestions(BaseScienceBowlQuestions):
     -------
     assign(question_spec: ParsedQuestionSpec)
         Assigns the questions to a specification via a linear sum assignment.
+    category_codes(question_spec: ParsedQuestionSpec)
+        Encodes the categorical columns against a specification's codebooks.
     """
 
     def __init__(self, document: docx.document.Document) -> Self:
 
         super().__init__(document)
 
+        # category codes shared with the last spec passed to assign()
+        self._encoded_spec = None
+        self._encoded = {}
+
         try:
-            self.difficulties
-            self.tubs
-            self.qtypes
+            self._parsed_columns
         except ValueError as ex:
             raise ValueError(
                 "One or more issues with the question document."
@@ -57,6 +74,36 @@ class EditedQuestions(BaseScienceBowlQuestions):
                 ex,
             )
 
+    @cached_property
+    def _parsed_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Reads the TUB, Ques and LOD columns in a single pass over the rows and
+        returns the parsed (tubs, qtypes, difficulties). Raises ValueError if any
+        of them are malformed."""
+        raw = np.array(
+            [
+                (row[0].text, row[2].paragraphs[0].runs[0].text, row[3].text)
+                for row in self._cell_grid[1:]
+            ],
+            dtype=str,
+        ).reshape(-1, 3)
+
+        difficulties = _parse_difficulties(raw[:, 2])
+        tubs = _parse_tubs(raw[:, 0])
+        qtypes = _parse_qtypes(raw[:, 1])
+        return tubs, qtypes, difficulties
+
+    @property
+    def tubs(self) -> np.ndarray:
+        return self._parsed_columns[0]
+
+    @property
+    def qtypes(self) -> np.ndarray:
+        return self._parsed_columns[1]
+
+    @property
+    def difficulties(self) -> np.ndarray:
+        return self._parsed_columns[2]
+
     def assign(
         self, question_spec: ParsedQuestionSpec, dry_run: Optional[bool] = False
     ):
@@ -84,11 +131,16 @@ class EditedQuestions(BaseScienceBowlQuestions):
 
         cost_matrix = build_cost_matrix(questions=self, spec=question_spec)
 
-        q_assignments, round_assignments = linear_sum_assignment(cost_matrix)
-        assignment_costs = cost_matrix[q_assignments, round_assignments]
+        q_assignments, round_assignments = solve_assignment(cost_matrix)
+
+        # slots count as unfilled if they were given an invalid question, or none
+        # at all because too few questions were usable
+        unfilled = np.ones(question_spec.difficulties.size, dtype=bool)
+        valid = cost_matrix[q_assignments, round_assignments] != INVALID_ASSIGNMENT_COST
+        unfilled[round_assignments[valid]] = False
 
-        if assignment_costs.sum() > 1_000_000:
-            self._raise_assignment_failure(question_spec, assignment_costs)
+        if unfilled.any():
+            self._raise_assignment_failure(question_spec, np.flatnonzero(unfilled))
 
         else:
             self._write_assignment(
@@ -106,37 +158,35 @@ class EditedQuestions(BaseScienceBowlQuestions):
         this question set."""
         if not dry_run:
             print("\nFound a successful set of assignments!")
-            for q_idx, spec_idx in zip(q_assignments, round_assignments):
-                self.sets[q_idx].text = question_spec.sets[spec_idx]
-                self.rounds[q_idx].text = question_spec.rounds[spec_idx]
-                self.qletters[q_idx].text = question_spec.qletters[spec_idx]
+            # the Set column is about to change, so its codes go stale
+            self._encoded_spec = None
+            for col_idx, spec_values in (
+                (5, question_spec.sets),
+                (6, question_spec.rounds),
+                (7, question_spec.qletters),
+            ):
+                cells = self._column(col_idx)[q_assignments]
+                values = spec_values[round_assignments].tolist()
+                for cell, value in zip(cells, values):
+                    # skip cells that already hold the right value
+                    if cell.text != value:
+                        set_cell_text(cell, value)
         else:
             print("\nNot writing assignments as this is a dry run.")
 
     def _raise_assignment_failure(
-        self, question_spec: ParsedQuestionSpec, assignment_costs: np.ndarray
+        self, question_spec: ParsedQuestionSpec, unfilled_slots: np.ndarray
     ):
-        """In case assignment fails, find the questions in the spec that failed to
-        be assigned and return them to the user."""
-        where_bad_assigns = np.argwhere(
-            assignment_costs == assignment_costs.max()
-        ).ravel()
-        failed_assignments = [
-            question_spec.question_list[idx] for idx in where_bad_assigns
-        ]
-
-        failed_sets = (question.set for question in failed_assignments)
-        failed_diff = (question.difficulty for question in failed_assignments)
-        failed_tubs = (question.tub for question in failed_assignments)
-        failed_qtypes = (question.qtype for question in failed_assignments)
-
+        """In case assignment fails, report the questions in the spec that failed to
+        be assigned to the user."""
         raw_values = np.array(
             [
-                f"{set_:<10}{difficulty:^5}{tub.value:^5}{qtype.value:>20}"
-                if qtype is not None
-                else f"{set_:<10}{difficulty:^5}{tub.value:^5}{'Any':>20}"
+                f"{set_:<10}{difficulty:^5}{tub:^5}{qtype or 'Any':>20}"
                 for set_, difficulty, tub, qtype in zip(
-                    failed_sets, failed_diff, failed_tubs, failed_qtypes
+                    question_spec.sets[unfilled_slots],
+                    question_spec.difficulties[unfilled_slots].tolist(),
+                    question_spec.tubs[unfilled_slots],
+                    question_spec.qtypes[unfilled_slots],
                 )
             ]
         )
@@ -157,6 +207,43 @@ class EditedQuestions(BaseScienceBowlQuestions):
             f"{failed_table}"
         )
 
+    def category_codes(
+        self, question_spec: ParsedQuestionSpec
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Encodes the categorical columns of these questions and question_spec
+        against shared codebooks, so they can be compared as small integers.
+
+        The codes are cached for the last question_spec object passed in (by
+        identity), so repeated assign() calls with the same spec only need to
+        rebuild the cost matrix. The cache is dropped when an assignment is
+        written back to the Set column.
+
+        Parameters
+        ----------
+        question_spec : ParsedQuestionSpec
+
+        Returns
+        -------
+        Dict[str, Tuple[np.ndarray, np.ndarray]]
+            (question codes, spec codes) pairs keyed by "tubs", "qtypes",
+            "subcategories" and "sets", plus a "has_set" boolean array marking
+            the questions whose Set is more specific than a bare packet name.
+        """
+        if self._encoded_spec is not question_spec:
+            q_sets = np.array([x.text for x in self.sets])
+            self._encoded = {
+                "tubs": encode_categories(self.tubs, question_spec.tubs),
+                "qtypes": encode_categories(self.qtypes, question_spec.qtypes),
+                "subcategories": encode_categories(
+                    self.subcategories, question_spec.subcategories
+                ),
+                "sets": encode_categories(q_sets, question_spec.sets),
+                "has_set": ~np.isin(q_sets, question_spec.packets),
+            }
+            self._encoded_spec = question_spec
+
+        return self._encoded
+
     def _report_stats(self, question_spec: ParsedQuestionSpec):
 
         print("\nStatistics")
@@ -183,7 +270,8 @@ class EditedQuestions(BaseScienceBowlQuestions):
                 " in this document to fill the specified rounds."
             )
 
-        if any(x.text for x in self.rounds) or any(x.text for x in self.qletters):
+        assignment_cells = self._cell_grid[1:, 6:8].ravel()
+        if any(cell.text for cell in assignment_cells):
             while True:
                 user_input = input(
                     "The Round and Q Letter columns are not empty in this document.\n"
@@ -195,10 +283,8 @@ class EditedQuestions(BaseScienceBowlQuestions):
             if user_input.lower() == "n":
                 raise ValueError("Aborted!")
             else:
-                for round_ in self.rounds:
-                    round_.text = ""
-                for qletter in self.qletters:
-                    qletter.text = ""
+                for cell in assignment_cells:
+                    cell.text = ""
 
 
 def build_cost_matrix(
@@ -219,45 +305,103 @@ def build_cost_matrix(
     np.ndarray
         Cost matrix with questions represented by rows and slots by columns.
     """
-    # randomness, can be seeded in the config file
-    random_matrix = spec.config.rng.uniform(
+    # the float terms below accumulate into this one buffer in-place. the integer
+    # LOD difference and the boolean subcategory mismatch mask are still
+    # (questions x slots) temporaries, but they are smaller than float64.
+    # randomness, can be seeded in the config file. the full matrix is drawn so
+    # that a given Random Seed keeps producing the same assignment
+    cost_matrix = spec.config.rng.uniform(
         0,
         0.0001,
         size=(questions.difficulties.size, spec.difficulties.size),
     )
 
-    # squared loss for difficulties
-    diff_matrix = (spec.difficulties - questions.difficulties[:, np.newaxis]) ** 2
+    # squared loss for difficulties. LODs are integers, so the loss is computed
+    # in int32 (int16 would wrap once the difference exceeds 181) and only
+    # converted to float when added to the costs
+    diff_matrix = np.subtract(
+        spec.difficulties, questions.difficulties[:, np.newaxis], dtype=np.int32
+    )
+    np.square(diff_matrix, out=diff_matrix)
+    cost_matrix += diff_matrix
 
     # penalize subcategory mismatches
-    subcat_matrix = np.where(
-        (spec.subcategories != questions.subcategories[:, np.newaxis])
-        & (spec.subcategories != ""),
+    q_subcats, spec_subcats = questions.category_codes(spec)["subcategories"]
+    np.add(
+        cost_matrix,
         spec.config.subcat_mismatch_penalty,
-        0,
+        out=cost_matrix,
+        where=(spec_subcats != q_subcats[:, np.newaxis]) & (spec.subcategories != ""),
     )
 
     # penalize unpreferred writers
     if spec.config.preferred_writers:
-        writer_matrix = np.where(
-            (
-                questions.writers[:, np.newaxis]
-                != np.array(spec.config.preferred_writers)
-            ).all(axis=1),
-            0.1,
-            0,
-        )[:, np.newaxis]
-    else:
-        writer_matrix = np.zeros_like(diff_matrix)
-
-    cost_matrix = random_matrix + diff_matrix + subcat_matrix + writer_matrix
+        not_preferred = ~np.isin(
+            questions.writers, np.asarray(spec.config.preferred_writers)
+        )
+        cost_matrix[not_preferred] += 0.1
+
     invalid_assignments = invalid_assignment_mask(questions, spec)
     # invalid assignments need a finite but large cost
-    cost_matrix[invalid_assignments] = 1_000_000
+    cost_matrix[invalid_assignments] = INVALID_ASSIGNMENT_COST
 
     return cost_matrix
 
 
+def solve_assignment(cost_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Finds a minimum cost assignment of questions (rows) to slots (columns).
+
+    Valid entries of the cost matrix define a bipartite graph between questions and
+    slots. Each connected component of that graph (e.g. one per set and TUB) is
+    solved on its own with a sparse bipartite matching solver. If a component has no
+    assignment that avoids every invalid entry, it falls back to a dense linear sum
+    assignment so that the slots that could not be filled can be reported.
+
+    Parameters
+    ----------
+    cost_matrix : np.ndarray
+        Cost matrix from build_cost_matrix.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Row indices and the column indices they are assigned to.
+    """
+    n_questions = cost_matrix.shape[0]
+    rows, cols = np.nonzero(cost_matrix != INVALID_ASSIGNMENT_COST)
+    # every full matching has the same number of edges, so shifting the weights by
+    # one leaves the optimum unchanged and keeps zero-cost edges from being dropped
+    biadjacency = csr_matrix(
+        (cost_matrix[rows, cols] + 1, (rows, cols)), shape=cost_matrix.shape
+    )
+
+    _, labels = connected_components(
+        bmat([[None, biadjacency], [biadjacency.T, None]]), directed=False
+    )
+    q_labels, slot_labels = labels[:n_questions], labels[n_questions:]
+
+    q_assignments, round_assignments = [np.empty(0, int)], [np.empty(0, int)]
+    # questions that cannot fill any slot are in components without slots, and
+    # are never handed to a solver
+    for component in np.unique(slot_labels):
+        q_idx = np.flatnonzero(q_labels == component)
+        slot_idx = np.flatnonzero(slot_labels == component)
+
+        try:
+            q_sub, slot_sub = min_weight_full_bipartite_matching(
+                biadjacency[q_idx][:, slot_idx]
+            )
+        except ValueError:
+            q_sub, slot_sub = linear_sum_assignment(
+                cost_matrix[np.ix_(q_idx, slot_idx)]
+            )
+
+        q_assignments.append(q_idx[q_sub])
+        round_assignments.append(slot_idx[slot_sub])
+
+    return np.concatenate(q_assignments), np.concatenate(round_assignments)
+
+
 def invalid_assignment_mask(
     questions: EditedQuestions, spec: ParsedQuestionSpec
 ) -> np.ndarray:
@@ -281,20 +425,42 @@ def invalid_assignment_mask(
     np.ndarray
         2D Boolean mask for the cost matrix where True indicates an invalid assignment.
     """
-    masks = []
+    invalid = np.zeros((questions.difficulties.size, spec.difficulties.size), bool)
     # mask to indicate where question LODs are missing
-    masks.append(questions.difficulties[:, np.newaxis] == -1)
+    invalid |= questions.difficulties[:, np.newaxis] == -1
 
     # mask to indicate where toss-up/bonus do not match
-    masks.append(spec.tubs != questions.tubs[:, np.newaxis])
+    codes = questions.category_codes(spec)
+    q_tubs, spec_tubs = codes["tubs"]
+    invalid |= spec_tubs != q_tubs[:, np.newaxis]
 
     # mask to indicate where Short Answer/Multiple Choice do not match
-    masks.append((spec.qtypes != questions.qtypes[:, np.newaxis]) & (spec.qtypes != ""))
+    q_qtypes, spec_qtypes = codes["qtypes"]
+    invalid |= (spec_qtypes != q_qtypes[:, np.newaxis]) & (spec.qtypes != "")
 
     # mask to indicate where Sets match, if the question has a Set indicated
-    q_sets = np.array([x.text for x in questions.sets])[:, np.newaxis]
-    packets = np.unique([x.split("-")[0] for x in spec.sets])
-    masks.append((spec.sets != q_sets) & (q_sets != packets).all(axis=1)[:, np.newaxis])
+    q_set_codes, spec_set_codes = codes["sets"]
+    q_has_set = codes["has_set"]
+    invalid |= (spec_set_codes != q_set_codes[:, np.newaxis]) & q_has_set[:, np.newaxis]
+
+    return invalid
+
+
+def encode_categories(*arrays: np.ndarray) -> List[np.ndarray]:
+    """Encodes string arrays as integer codes drawn from a single shared codebook, so
+    that broadcast comparisons between them are done on small integers rather than
+    on fixed-width unicode strings.
 
-    # apply all masks
-    return reduce(np.logical_or, masks)
+    Parameters
+    ----------
+    *arrays : np.ndarray
+        1D string arrays to encode.
+
+    Returns
+    -------
+    List[np.ndarray]
+        Integer code arrays, in the same order and with the same lengths as arrays.
+    """
+    categories, codes = np.unique(np.concatenate(arrays), return_inverse=True)
+    codes = codes.ravel().astype(np.min_scalar_type(categories.size))
+    return np.split(codes, np.cumsum([array.size for array in arrays[:-1]]))
@@ -21,21 +21,23 @@ class TossUpBonus(Enum):
         -------
         ClassInstance
         """
-
-        _ALIASES = {
-            "tu": TossUpBonus.TOSS_UP,
-            "toss-up": TossUpBonus.TOSS_UP,
-            "b": TossUpBonus.BONUS,
-            "bonus": TossUpBonus.BONUS,
-            "vb": TossUpBonus.VISUAL_BONUS,
-            "visual bonus": TossUpBonus.VISUAL_BONUS,
-        }
         try:
-            return _ALIASES[label.lower()]
+            return _TUB_ALIASES[label.lower()]
         except KeyError:
             return TossUpBonus(label)
 
 
+# alias tables are built once at import rather than on every from_string call
+_TUB_ALIASES = {
+    "tu": TossUpBonus.TOSS_UP,
+    "toss-up": TossUpBonus.TOSS_UP,
+    "b": TossUpBonus.BONUS,
+    "bonus": TossUpBonus.BONUS,
+    "vb": TossUpBonus.VISUAL_BONUS,
+    "visual bonus": TossUpBonus.VISUAL_BONUS,
+}
+
+
 class Subject(Enum):
     LIFE_SCIENCE = "Life Science"
     BIOLOGY = "Biology"
@@ -59,21 +61,26 @@ class Subject(Enum):
         -------
         ClassInstance
         """
-        _ALIASES = {
-            Subject.LIFE_SCIENCE: ("LIFE SCIENCE", "LS"),
-            Subject.BIOLOGY: ("BIOLOGY", "B"),
-            Subject.PHYSICAL_SCIENCE: ("PHYSICAL SCIENCE", "PS"),
-            Subject.CHEMISTRY: ("CHEMISTRY", "C"),
-            Subject.PHYSICS: ("PHYSICS", "P"),
-            Subject.MATH: ("MATH", "M"),
-            Subject.ESSC: ("EARTH AND SPACE", "ES"),
-            Subject.ENERGY: ("ENERGY", "EN"),
-        }
-        for enum_type in _ALIASES.keys():
-            if label.upper() in _ALIASES[enum_type]:
-                return enum_type
-        else:
-            raise ValueError(f"{label} is not a valid Subject")
+        try:
+            return _SUBJECT_ALIASES[label.upper()]
+        except KeyError:
+            raise ValueError(f"{label} is not a valid Subject") from None
+
+
+_SUBJECT_ALIASES = {
+    alias: subject
+    for subject, aliases in {
+        Subject.LIFE_SCIENCE: ("LIFE SCIENCE", "LS"),
+        Subject.BIOLOGY: ("BIOLOGY", "B"),
+        Subject.PHYSICAL_SCIENCE: ("PHYSICAL SCIENCE", "PS"),
+        Subject.CHEMISTRY: ("CHEMISTRY", "C"),
+        Subject.PHYSICS: ("PHYSICS", "P"),
+        Subject.MATH: ("MATH", "M"),
+        Subject.ESSC: ("EARTH AND SPACE", "ES"),
+        Subject.ENERGY: ("ENERGY", "EN"),
+    }.items()
+    for alias in aliases
+}
 
 
 class QuestionType(Enum):
@@ -93,15 +100,18 @@ class QuestionType(Enum):
         -------
         ClassInstance
         """
-        _ALIASES = {
-            QuestionType.MULTIPLE_CHOICE: ("MULTIPLE CHOICE", "MC"),
-            QuestionType.SHORT_ANSWER: ("SHORT ANSWER", "SA"),
-        }
-        for enum_type in _ALIASES.keys():
-            if label.upper() in (x.upper() for x in _ALIASES[enum_type]):
-                return enum_type
-        else:
-            raise ValueError(f"{label} is not a valid Subject")
+        try:
+            return _QTYPE_ALIASES[label.upper()]
+        except KeyError:
+            raise ValueError(f"{label} is not a valid QuestionType") from None
+
+
+_QTYPE_ALIASES = {
+    "MULTIPLE CHOICE": QuestionType.MULTIPLE_CHOICE,
+    "MC": QuestionType.MULTIPLE_CHOICE,
+    "SHORT ANSWER": QuestionType.SHORT_ANSWER,
+    "SA": QuestionType.SHORT_ANSWER,
+}
 
 
 class RowContextFilter(logging.Filter):
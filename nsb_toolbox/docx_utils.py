@@ -1,8 +1,10 @@
-from typing import Generator
-from docx.table import _Cell
+from functools import lru_cache
+from typing import List
+from docx.table import Table, _Cell
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 from docx.oxml.shared import OxmlElement, qn
+from docx.oxml.text.paragraph import CT_P
 from docx.enum.text import WD_COLOR_INDEX
 
 from copy import deepcopy
@@ -19,12 +21,13 @@ def preprocess_cell(cell: _Cell) -> _Cell:
     -------
     _Cell
     """
-    highlight_cell_text(cell, None)
-
-    if cell.text.strip() == "":
+    # blank cells are common and get cleared anyway, so skip the rest
+    if cell_is_empty(cell):
         clear_cell(cell)
 
     else:
+        highlight_cell_text(cell, None)
+
         # this pass replaces all soft returns with hard returns
         for para in cell.paragraphs:
             split_soft_returns(para)
@@ -34,14 +37,19 @@ def preprocess_cell(cell: _Cell) -> _Cell:
             # this pass coerces the font of any whitespace-only runs to
             # the document style
             for run in para.runs:
+                # run.text is rebuilt from the XML on every read, and setting it
+                # rewrites the run, so read it once and only write it back if
+                # it changes
+                text = run.text
                 # replace non-breaking spaces with regular spaces
-                run.text = run.text.replace("\xa0", " ")
+                if "\xa0" in text:
+                    run.text = text = text.replace("\xa0", " ")
                 # if there are empty runs, delete them
-                if run.text == "":
+                if text == "":
                     delete_run(run)
                 # if there is a weirdly formatted run that is only whitespace,
                 # strip their formatting
-                elif run.text.strip() == "":
+                elif text.strip() == "":
                     run.font.italic = (
                         run.font.bold
                     ) = (
@@ -77,22 +85,20 @@ def strip_padding_whitespace(para: Paragraph, leading=True):
         If true, strips left padding, otherwise strips right padding,
         by default True
     """
-    if leading:
-        target_idx = 0
-
-    else:
-        target_idx = -1
-
-    target_run = para.runs[target_idx]
-
-    while not target_run.text.strip():
+    runs = para.runs
+    if not leading:
+        runs.reverse()
+
+    # walk the runs once from the padded end rather than re-reading para.runs
+    # after every deletion
+    for target_run in runs:
+        if (text := target_run.text).strip():
+            break
         delete_run(target_run)
-        target_run = para.runs[target_idx]
 
-    if leading:
-        target_run.text = target_run.text.lstrip()
-    else:
-        target_run.text = target_run.text.rstrip()
+    stripped = text.lstrip() if leading else text.rstrip()
+    if stripped != text:
+        target_run.text = stripped
 
 
 def split_soft_returns(para: Paragraph) -> Paragraph:
@@ -138,7 +144,8 @@ def fuse_consecutive_runs(para: Paragraph) -> Paragraph:
     -------
     Paragraph
     """
-    for run_1, run_2 in zip(para.runs[:-1], para.runs[1:]):
+    runs = para.runs
+    for run_1, run_2 in zip(runs[:-1], runs[1:]):
         if compare_run_styles(run_1, run_2):
             run_2.text = run_1.text + run_2.text
             delete_run(run_1)
@@ -189,12 +196,12 @@ def split_run_at(run: Run, split_at: int):
     split_at %= len(txt)
     left, right = [txt[:split_at], txt[split_at:]]
 
-    run_2 = deepcopy(run._r)
+    run_2 = Run(deepcopy(run._r), run._parent)
 
     run.text, run_2.text = left, right
 
     # move second run to be after first run
-    run._r.addnext(run_2)
+    run._r.addnext(run_2._r)
 
     return [run, run_2]
 
@@ -212,19 +219,32 @@ def move_runs_to_end_of_para(para_from: Paragraph, para_to: Paragraph) -> None:
 
 
 def shade_cell(cell, shade: str) -> None:
-    """Shades a list of cells in-place with a hex color value.
+    """Shades a cell in-place with a hex color value. An existing shading element
+    is replaced rather than appending another one, so formatting a document
+    repeatedly doesn't grow it and no stale theme or pattern attributes survive.
 
     Parameters
     ----------
-    cells : Iterable
-        Cells to shade
+    cell : _Cell
+        Cell to shade
     shade : str
         Hexadecimal color value
     """
     tcPr = cell._tc.get_or_add_tcPr()
-    tcVAlign = OxmlElement("w:shd")
-    tcVAlign.set(qn("w:fill"), shade)
-    tcPr.append(tcVAlign)
+    new_shd = deepcopy(_shading_template(shade))
+    if (shd := tcPr.find(qn("w:shd"))) is None:
+        tcPr.append(new_shd)
+    else:
+        tcPr.replace(shd, new_shd)
+
+
+@lru_cache(maxsize=None)
+def _shading_template(shade: str) -> OxmlElement:
+    """Builds a <w:shd> element for a color. OxmlElement goes through the XML parser,
+    so shade_cell copies this template instead of building one per cell."""
+    shd = OxmlElement("w:shd")
+    shd.set(qn("w:fill"), shade)
+    return shd
 
 
 def delete_paragraph(paragraph: Paragraph) -> None:
@@ -240,6 +260,21 @@ def delete_run(run: Run) -> None:
     p.remove(run._r)
 
 
+def cell_is_empty(cell: _Cell) -> bool:
+    """Checks whether a cell holds only whitespace. Reads the text nodes directly
+    rather than reassembling cell.text.
+
+    Parameters
+    ----------
+    cell : _Cell
+
+    Returns
+    -------
+    bool
+    """
+    return not any(text.strip() for text in cell._tc.xpath(".//w:t/text()"))
+
+
 def clear_cell(cell: _Cell) -> None:
     """Deletes every paragraph in a cell except for the first, and makes the first
     paragraph contain only an empty run of text. Removes shading (and all other)
@@ -253,6 +288,23 @@ def clear_cell(cell: _Cell) -> None:
     cell.add_paragraph("").add_run("")
 
 
+def set_cell_text(cell: _Cell, text: str) -> None:
+    """Sets the text of a cell. If the cell holds a single run, only that run's text
+    is replaced, which avoids tearing down and rebuilding the cell's paragraphs.
+    Otherwise, falls back to replacing the cell's contents.
+
+    Parameters
+    ----------
+    cell : _Cell
+    text : str
+    """
+    tc = cell._tc
+    if len(tc.p_lst) == 1 and not tc.tbl_lst and len(r_lst := tc.p_lst[0].r_lst) == 1:
+        r_lst[0].text = text
+    else:
+        cell.text = text
+
+
 def highlight_cell_text(cell: _Cell, color: WD_COLOR_INDEX) -> None:
     """Highlights all the text in a cell a given color. Used for
     providing linter warnings.
@@ -262,8 +314,8 @@ def highlight_cell_text(cell: _Cell, color: WD_COLOR_INDEX) -> None:
     cell : _Cell
     color : WD_COLOR_INDEX
     """
-    for paragraph in cell.paragraphs:
-        highlight_paragraph_text(paragraph, color)
+    for p in cell._tc.p_lst:
+        _highlight_runs(p, color)
 
 
 def highlight_paragraph_text(para: Paragraph, color: WD_COLOR_INDEX) -> None:
@@ -274,8 +326,14 @@ def highlight_paragraph_text(para: Paragraph, color: WD_COLOR_INDEX) -> None:
     para : Paragraph
     color : WD_COLOR_INDEX
     """
-    for run in para.runs:
-        run.font.highlight_color = color
+    _highlight_runs(para._p, color)
+
+
+def _highlight_runs(p: CT_P, color: WD_COLOR_INDEX) -> None:
+    """Sets the highlight of every run in a paragraph element. This writes the
+    run properties directly instead of going through a Font proxy per run."""
+    for r in p.r_lst:
+        r.get_or_add_rPr().highlight_val = color
 
 
 def capitalize_paragraph(para: Paragraph) -> None:
@@ -286,31 +344,31 @@ def capitalize_paragraph(para: Paragraph) -> None:
     para : Paragraph
     """
     for run in para.runs:
-        run.text = run.text.upper()
+        # setting run.text rebuilds the run's XML, so skip runs that are already
+        # uppercase
+        if (upper := (text := run.text).upper()) != text:
+            run.text = upper
+
 
+def table_cells(table: Table) -> List[_Cell]:
+    """Returns every cell in a table in row-major order, like Table._cells.
 
-def column_indexer(
-    col_num: int, total_cells: int, col_count: int, skip_header: bool = True
-) -> Generator[int, None, None]:
-    """Convenience function to build iterators over columns in a table.
+    All of the table's <w:tc> elements are fetched with a single XPath query instead
+    of resolving merged cells row by row. If the table does contain merged cells,
+    falls back to Table._cells.
 
     Parameters
     ----------
-    col_num : int
-        Column number to iterate over, indexing starts at 0.
-    total_cells : int
-        Total number of cells in the table.
-    col_count : int
-        Number of columns in the table.
-    skip_header : bool, optional
-        If true, the iterator will skip the first instance, by default True
-
-    Yields
-    ------
-    Generator[int, None, None]
-        range generator that yields cell indexes for the column of interest.
+    table : Table
+
+    Returns
+    -------
+    List[_Cell]
     """
-    if skip_header:
-        return range(col_num + col_count, total_cells, col_count)
-    else:
-        return range(col_num, total_cells, col_count)
+    tbl = table._tbl
+    tcs = tbl.xpath("./w:tr/w:tc")
+    if len(tcs) != len(tbl.tr_lst) * table._column_count or tbl.xpath(
+        "./w:tr/w:tc/w:tcPr/w:vMerge"
+    ):
+        return table._cells
+    return [_Cell(tc, table) for tc in tcs]
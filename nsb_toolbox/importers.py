@@ -5,6 +5,9 @@ from docx.document import Document as DocClass
 from docx import Document
 import yaml
 
+# libyaml's loader is much faster, but pyyaml may be built without it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def validate_path(path_string: Union[str, Path]) -> Path:
     """Validates that incoming path exists.
@@ -40,12 +43,17 @@ def load_yaml(path: Union[Path, str]) -> Dict:
     -------
     Dict
 
-    """
-    path = validate_path(path)
+    Raises
+    ------
+    FileNotFoundError
 
-    with open(path) as file:
-        data = yaml.safe_load(file)
-        return data
+    """
+    # opening the file checks that it exists, so there's no separate stat call
+    try:
+        with open(path) as file:
+            return yaml.load(file, Loader=SafeLoader)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No such file: {path}") from None
 
 
 def load_doc(path: Union[Path, str]) -> DocClass:
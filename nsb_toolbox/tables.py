@@ -1,9 +1,10 @@
 import logging
 import re
 from copy import deepcopy
+from dataclasses import dataclass, field
 from enum import Enum
-from functools import cached_property, partial
-from typing import Dict, Iterable, Optional, Union
+from functools import cached_property
+from typing import Dict, Optional, Tuple, Union
 from typing_extensions import Self
 
 from docx import Document
@@ -14,7 +15,11 @@ from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 import numpy as np
 
-from ._base_questions import BaseScienceBowlQuestions
+from ._base_questions import (
+    BaseScienceBowlQuestions,
+    _map_unique,
+    _parse_difficulties,
+)
 
 from .classes import (
     QuestionType,
@@ -25,8 +30,8 @@ from .classes import (
 )
 from .docx_utils import (
     capitalize_paragraph,
+    cell_is_empty,
     clear_cell,
-    column_indexer,
     fuse_consecutive_runs,
     highlight_cell_text,
     highlight_paragraph_text,
@@ -34,6 +39,7 @@ from .docx_utils import (
     preprocess_cell,
     shade_cell,
     split_run_at,
+    table_cells,
 )
 
 
@@ -64,6 +70,8 @@ COL_WIDTHS = (
     1.51,
     1.44,
 )
+# column widths converted to EMUs once, rather than on every table made
+COL_WIDTHS_EMU = tuple(Inches(width) for width in COL_WIDTHS)
 
 COL_MAPPING = {
     "TUB": 0,
@@ -97,17 +105,50 @@ COL_COLORS = {
     "Subcat": None,
 }
 
-TUB_RE = re.compile(r"\s*(TOSS-UP|BONUS|VISUAL BONUS|TU|B|VB)\b", re.IGNORECASE)
-SUBJECT_RE = re.compile(
-    r"\s*(BIOLOGY|B|CHEMISTRY|C|EARTH AND SPACE|ES|ENERGY|EN|MATH|M|PHYSICS|P)\b",
-    re.IGNORECASE,
+TUB_LABELS = ("TOSS-UP", "BONUS", "VISUAL BONUS", "TU", "B", "VB")
+SUBJECT_LABELS = (
+    "BIOLOGY",
+    "B",
+    "CHEMISTRY",
+    "C",
+    "EARTH AND SPACE",
+    "ES",
+    "ENERGY",
+    "EN",
+    "MATH",
+    "M",
+    "PHYSICS",
+    "P",
+)
+TUB_RE = re.compile(rf"\s*({'|'.join(TUB_LABELS)})\b", re.IGNORECASE)
+SUBJECT_RE = re.compile(rf"\s*({'|'.join(SUBJECT_LABELS)})\b", re.IGNORECASE)
+# canonical cell text for each label, so most cells are resolved without the regex
+TUB_VALUES = {label: TossUpBonus.from_string(label).value for label in TUB_LABELS}
+SUBJECT_VALUES = {label: Subject.from_string(label).value for label in SUBJECT_LABELS}
+Q_TYPE_RE = re.compile(r"\s*(Short Answer|Multiple Choice|SA|MC)\s*", re.IGNORECASE)
+CHOICES_RE = re.compile(r"\s*([WXYZ]\))\s*", re.IGNORECASE)
+# answer line; for multiple choice, group 2 captures the letter of the answer, which
+# is either alone (with an optional parenthesis) or followed by the choice's text in
+# group 3
+ANSWER_RE = re.compile(r"\s*(ANSWER:)\s*(?:([WXYZ])(?:\)?$|\)(.+)))?", re.IGNORECASE)
+# paragraph after the stem: either the first choice or the answer line
+STEM_END_RE = re.compile(
+    r"\s*(?:(?P<choice>[WXYZ]\))|(?P<answer>ANSWER:))", re.IGNORECASE
 )
-Q_TYPE_RE = re.compile(r"\s*(Short Answer|SA|Multiple Choice|MC)\s*", re.IGNORECASE)
-CHOICES_RE = re.compile(r"\s*([W|X|Y|Z]\))\s*", re.IGNORECASE)
-TEST_CHOICE_RE = re.compile(r"(?:ANSWER:)?\s*([W|X|Y|Z])(?:\)?$|\).+)", re.IGNORECASE)
-ANSWER_RE = re.compile(r"\s*(ANSWER:)\s*", re.IGNORECASE)
+# first characters Q_TYPE_RE and STEM_END_RE can match on; most paragraphs start
+# with something else, which is cheaper to rule out than to run the regex
+Q_TYPE_FIRST_CHARS = frozenset("SMsm")
+STEM_END_FIRST_CHARS = frozenset("WXYZAwxyza")
 
 CHOICES = ("W)", "X)", "Y)", "Z)")
+# maps a choice letter to its position in CHOICES
+CHOICE_INDEX = {choice[0]: idx for idx, choice in enumerate(CHOICES)}
+
+PARSE_ERROR_MSGS = {
+    ANSWER_RE: "Found answer line, but couldn't find W, X, Y, or Z.",
+    CHOICES_RE: "Couldn't parse question. Check that choices are correct.",
+    Q_TYPE_RE: "Couldn't parse question. Check that question type is correct.",
+}
 
 
 class RawQuestions(BaseScienceBowlQuestions):
@@ -148,36 +189,28 @@ class RawQuestions(BaseScienceBowlQuestions):
         table.autofit = False
         table.allow_autofit = False
 
-        _cells = table._cells
+        _cells = table_cells(table)
         _col_count = table._column_count
 
-        col_iter = partial(
-            column_indexer,
-            total_cells=len(_cells),
-            col_count=_col_count,
-            skip_header=False,
-        )
+        # text to fill into every body cell of a column, decided once per column
+        fills = {"Subj": subj, "Set": set, "Author": name}
 
         for col_name, col_idx in COL_MAPPING.items():
-            for cell_idx in col_iter(col_idx):
-                cell = _cells[cell_idx]
-                cell.width = Inches(COL_WIDTHS[col_idx])
-
-                if cell_idx < _col_count:
-                    cell.paragraphs[0].add_run(col_name)
+            # columns have a constant stride, so a slice walks one in C
+            header, *col_cells = _cells[col_idx::_col_count]
+            width = COL_WIDTHS_EMU[col_idx]
 
-                elif col_name == "Subj" and subj is not None:
-                    cell.paragraphs[0].text = subj
+            header.width = width
+            header.paragraphs[0].add_run(col_name)
 
-                elif col_name == "Set":
-                    if set is not None:
-                        cell.paragraphs[0].text = set
-
-                elif col_name == "Author" and name is not None:
-                    cell.paragraphs[0].text = name
+            fill = fills.get(col_name)
+            for cell in col_cells:
+                cell.width = width
+                if fill is not None:
+                    cell.paragraphs[0].text = fill
 
         # ques header is italicized
-        ques_run = table.cell(0, COL_MAPPING["Ques"]).paragraphs[0].runs[0]
+        ques_run = _cells[COL_MAPPING["Ques"]].paragraphs[0].runs[0]
         ques_run.italic = True
 
         return cls(document)
@@ -207,49 +240,48 @@ class RawQuestions(BaseScienceBowlQuestions):
             If True, all answer lines will be capitalized
         """
 
-        cols_to_format = (
-            "TUB",
-            "Subj",
-            "Ques",
-            "LOD",
-            "Set",
-            "Rd",
-            "Q Letter",
-            "Author",
-            "Subcat",
-        )
-
-        FORMATTERS = {
-            "TUB": TuBCellFormatter(),
-            "Subj": SubjectCellFormatter(),
-            "Ques": QuestionCellFormatter(
-                force_capitalize=force_capitalize, line_after_stem=line_after_stem
+        # (column, formatter) pairs, in the order each row's cells are formatted
+        formatters = (
+            (COL_MAPPING["TUB"], TuBCellFormatter()),
+            (COL_MAPPING["Subj"], SubjectCellFormatter()),
+            (
+                COL_MAPPING["Ques"],
+                QuestionCellFormatter(
+                    force_capitalize=force_capitalize, line_after_stem=line_after_stem
+                ),
             ),
-            "LOD": DifficultyFormatter(),
-            "Set": SetFormatter(),
-            "Rd": RdFormatter(),
-            "Q Letter": QLetterFormatter(),
-        }
+            (COL_MAPPING["LOD"], DifficultyFormatter()),
+            (COL_MAPPING["Set"], SetFormatter()),
+            (COL_MAPPING["Rd"], RdFormatter()),
+            (COL_MAPPING["Q Letter"], QLetterFormatter()),
+            (COL_MAPPING["Author"], CellFormatter()),
+            (COL_MAPPING["Subcat"], CellFormatter()),
+        )
 
-        _cells = self.document.tables[0]._cells
-        _col_count = self.document.tables[0]._column_count
+        # the cell list is snapshotted when this instance is created. formatting
+        # edits cells in place, but adding or removing rows is not supported.
+        _cells = self._cells
+        _col_count = self._col_count
+        # cells are indexed by their COL_MAPPING offset within each row
+        if _col_count < len(COL_MAPPING):
+            raise ValueError(
+                f"Question table must have at least {len(COL_MAPPING)} columns, "
+                f"found {_col_count}."
+            )
 
         font = self.document.styles["Normal"].font
         font.name = "Times New Roman"
         font.size = Pt(12)
 
-        col_iter = partial(
-            column_indexer,
-            total_cells=len(_cells),
-            col_count=_col_count,
-            skip_header=True,
-        )
+        # a single pass over the rows touches each row's cells together, and
+        # errors are reported in row order
+        for row_idx, row_start in enumerate(
+            range(_col_count, len(_cells), _col_count), start=1
+        ):
+            row_filter.curr_row = row_idx
+            for col_idx, formatter in formatters:
+                formatter.preprocess_format(_cells[row_start + col_idx])
 
-        for col_name in cols_to_format:
-            formatter = FORMATTERS.get(col_name, CellFormatter())
-            formatter.preprocess_format_column(
-                _cells[i] for i in col_iter(COL_MAPPING[col_name])
-            )
         if verbose:
             if row_filter._num_records == 0:
                 print("Found no errors 😄")
@@ -275,51 +307,46 @@ class RawQuestions(BaseScienceBowlQuestions):
     @cached_property
     def tubs(self) -> np.ndarray:
         """Overridden because TUB might be malformed."""
-        return np.array(
-            [
-                TossUpBonus(self._cells[i].text).value
-                if self._cells[i].text in ("TOSS-UP", "BONUS", "VISUAL BONUS")
+        return _map_unique(
+            np.array([cell.text for cell in self._column(0)], dtype="<U20"),
+            lambda tub: (
+                TossUpBonus(tub).value
+                if tub in ("TOSS-UP", "BONUS", "VISUAL BONUS")
                 else "ERROR"
-                for i in column_indexer(0, len(self._cells), self._col_count)
-            ],
-            dtype="<U20",
+            ),
         )
 
     @cached_property
     def difficulties(self) -> np.ndarray:
         """Overridden because difficulties may be written in LOD-A column."""
-        return np.array(
-            [
-                int(self._cells[lod].text or self._cells[lod_a].text or -1)
-                for lod, lod_a in zip(
-                    column_indexer(3, len(self._cells), self._col_count),
-                    column_indexer(4, len(self._cells), self._col_count),
-                )
-            ]
-        )
+        lods = np.array([cell.text for cell in self._column(3)])
+        lods_a = np.array([cell.text for cell in self._column(4)])
+        return _parse_difficulties(np.where(lods == "", lods_a, lods))
 
 
 class CellFormatter:
     """Base class that ensures formatters are standardized."""
 
+    color: Optional[str] = None
+    # whether preprocess_format cleans up the cell before formatting it
+    preprocess: bool = True
+
     def format(self, cell: _Cell) -> _Cell:
         """All CellFormatters have a format function."""
         return cell
 
     def preprocess_format(self, cell: _Cell) -> _Cell:
         """Convenience function to preprocess and format a cell."""
-        cell = preprocess_cell(cell)
-        if hasattr(self, "color"):
+        # preprocessing never empties a cell with text, so check only once
+        if empty := cell_is_empty(cell):
+            clear_cell(cell)
+        elif self.preprocess:
+            cell = preprocess_cell(cell)
+        if self.color is not None:
             shade_cell(cell, self.color)
-        if cell.text.strip() != "":
+        if not empty:
             return self.format(cell)
 
-    def preprocess_format_column(self, cells: Iterable[_Cell]) -> _Cell:
-        """Convenience function to preprocess and format an entire column."""
-        for idx, cell in enumerate(cells):
-            row_filter.curr_row = idx + 1
-            self.preprocess_format(cell)
-
 
 class QuestionParserException(Exception):
     pass
@@ -333,6 +360,18 @@ class QuestionFormatterState(Enum):
     DONE = 4
 
 
+@dataclass
+class _QuestionParse:
+    """Parse state for a single question cell. A fresh one is made for every call
+    to QuestionCellFormatter.format, so nothing carries over between cells."""
+
+    state: QuestionFormatterState = QuestionFormatterState.Q_START
+    q_type: Optional[QuestionType] = None
+    q_type_run: Optional[Run] = None
+    current_choice: int = 0
+    choices_para: Dict[int, Paragraph] = field(default_factory=dict)
+
+
 class QuestionCellFormatter(CellFormatter):
     """Formats a cell containing a Science Bowl Question."""
 
@@ -344,6 +383,15 @@ class QuestionCellFormatter(CellFormatter):
         self.force_capitalize = force_capitalize
         self.line_after_stem = line_after_stem
 
+        # one handler per state; each receives the cell's parse state, a paragraph
+        # and its text
+        self._dispatch = {
+            QuestionFormatterState.Q_START: self._start_handler,
+            QuestionFormatterState.STEM_END: self._stem_end_handler,
+            QuestionFormatterState.CHOICES: self._choice_handler,
+            QuestionFormatterState.ANSWER: self._answer_handler,
+        }
+
     def format(self, cell: _Cell) -> _Cell:
         """Takes a preprocessed question cell and returns a cell containing a
         properly-formatted Science Bowl question.
@@ -358,145 +406,192 @@ class QuestionCellFormatter(CellFormatter):
             Cell containing a formatteed Science Bowl question.
         """
 
-        state = QuestionFormatterState.Q_START
-        q_type = None
-        q_type_run = None
-        current_choice = 0
-        choices_para = {}
+        parse = _QuestionParse()
 
-        for para in cell.paragraphs:
-            if state is QuestionFormatterState.DONE:
+        # enum member lookups go through the Enum metaclass, so bind the loop's
+        # constants once
+        dispatch = self._dispatch
+        done = QuestionFormatterState.DONE
+        # wrap paragraphs one at a time rather than building cell.paragraphs
+        for p in cell._tc.p_lst:
+            para = Paragraph(p, cell)
+            # Paragraph.text joins every run on each access, so read it once
+            try:
+                dispatch[parse.state](parse, para, para.text)
+            except QuestionParserException as ex:
+                highlight_cell_text(cell, WD_COLOR_INDEX.RED)
+                logger.error(str(ex))
                 break
 
-            elif state is QuestionFormatterState.Q_START and Q_TYPE_RE.match(para.text):
-                try:
-                    run_match = _validate_element_text(
-                        q_type_run := para.runs[0], pattern=Q_TYPE_RE
-                    )
-                except QuestionParserException as ex:
-                    highlight_cell_text(cell, WD_COLOR_INDEX.RED)
-                    logger.error(str(ex))
-                    break
-
-                q_type = _format_question_type_run(q_type_run, run_match)
-
-                if len(para.runs) == 1:
-                    try:
-                        _combine_qtype_and_stem_paragraphs(para)
-                    except QuestionParserException as ex:
-                        highlight_cell_text(cell, WD_COLOR_INDEX.RED)
-                        logger.error(str(ex))
-                        break
-
-                # left pad the first run of the stem
-                _left_pad_stem(stem_run=para.runs[1])
-
-                state = QuestionFormatterState.STEM_END
-
-            elif state is QuestionFormatterState.STEM_END:
-                # handle incorrectly labeled questions and divert to the proper state
-                if CHOICES_RE.match(para.text):
-                    if q_type is QuestionType.SHORT_ANSWER:
-                        logger.warning("Question type is SA, but has choices.")
-                        q_type = _toggle_q_type_and_warn(q_type, q_type_run)
-                    state = QuestionFormatterState.CHOICES
-
-                elif ANSWER_RE.match(para.text):
-                    if q_type is QuestionType.MULTIPLE_CHOICE:
-                        logger.warning("Question type is MC, but has no choices.")
-                        q_type = _toggle_q_type_and_warn(q_type, q_type_run)
-                    state = QuestionFormatterState.ANSWER
-
-            # this is intentionally an if - stem_end should continue onto
-            # choices or answer
-            if state is QuestionFormatterState.CHOICES and CHOICES_RE.match(para.text):
-                try:
-                    run_match = _validate_element_text(
-                        (choice_run := para.runs[0]), pattern=CHOICES_RE
-                    )
-                except QuestionParserException as ex:
-                    highlight_cell_text(cell, WD_COLOR_INDEX.RED)
-                    logger.error(str(ex))
-                    break
-
-                _format_choice(run_match, choice_run, current_choice)
-
-                # if current_choice was 0 and line_after_stem is true, we need to
-                # insert a blank line before the first choice
-                if current_choice == 0 and self.line_after_stem:
-                    para.insert_paragraph_before("")
-
-                # save text and update the choice we're looking for
-                choices_para[current_choice] = para
-                current_choice += 1
-
-                if current_choice == 4:
-                    state = QuestionFormatterState.ANSWER
-
-            elif state is QuestionFormatterState.ANSWER and ANSWER_RE.match(para.text):
-                para.insert_paragraph_before("")
-
-                if self.force_capitalize:
-                    capitalize_paragraph(para)
-
-                if q_type is QuestionType.MULTIPLE_CHOICE:
-                    try:
-                        test_choice_match = _validate_element_text(para, TEST_CHOICE_RE)
-                    except QuestionParserException as ex:
-                        highlight_cell_text(cell, WD_COLOR_INDEX.RED)
-                        logger.error(str(ex))
-                        break
-
-                    try:
-                        _format_answer_line(para, test_choice_match, choices_para)
-                    except QuestionParserException as ex:
-                        logger.error(str(ex))
-
-                state = QuestionFormatterState.DONE
-
-        if state is not QuestionFormatterState.DONE:
+            # nothing after the answer line is parsed
+            if parse.state is done:
+                break
+
+        if parse.state is not done:
             highlight_cell_text(cell, WD_COLOR_INDEX.RED)
-            logger.error(f"Parsing failed while looking for {state}")
+            logger.error(f"Parsing failed while looking for {parse.state}")
 
         return cell
 
+    def _start_handler(self, parse: _QuestionParse, para: Paragraph, text: str):
+        """Formats the question type and the start of the stem."""
+        # the question type has to be in the first run, so match that directly.
+        # the whole paragraph is only checked to tell a question type split across
+        # runs apart from a paragraph that doesn't start a question
+        if text.lstrip()[:1] not in Q_TYPE_FIRST_CHARS:
+            return
+
+        runs = para.runs
+        if not runs or not (run_match := Q_TYPE_RE.match(runs[0].text)):
+            if Q_TYPE_RE.match(text):
+                raise QuestionParserException(PARSE_ERROR_MSGS[Q_TYPE_RE])
+            return
+
+        parse.q_type_run = q_type_run = runs[0]
+        parse.q_type, stem_run = _format_question_type_run(q_type_run, run_match)
+
+        # if the question type run wasn't split, the stem starts at the next run,
+        # which may still be in the next paragraph
+        if stem_run is None:
+            if len(runs) == 1:
+                _combine_qtype_and_stem_paragraphs(para)
+                runs = para.runs
+            stem_run = runs[1]
+
+        # left pad the first run of the stem
+        _left_pad_stem(stem_run=stem_run)
+
+        parse.state = QuestionFormatterState.STEM_END
+
+    def _stem_end_handler(self, parse: _QuestionParse, para: Paragraph, text: str):
+        """Looks for the end of the stem. Incorrectly labeled questions are
+        diverted to the proper state, and the paragraph is handed on to it."""
+        if text.lstrip()[:1] not in STEM_END_FIRST_CHARS:
+            return
+
+        stem_end = (match := STEM_END_RE.match(text)) and match.lastgroup
+        if stem_end == "choice":
+            if parse.q_type is QuestionType.SHORT_ANSWER:
+                logger.warning("Question type is SA, but has choices.")
+                parse.q_type = _toggle_q_type_and_warn(parse.q_type, parse.q_type_run)
+            parse.state = QuestionFormatterState.CHOICES
+            # STEM_END_RE already recognized the choice
+            self._choice_handler(parse, para, text, matched=True)
+
+        elif stem_end == "answer":
+            if parse.q_type is QuestionType.MULTIPLE_CHOICE:
+                logger.warning("Question type is MC, but has no choices.")
+                parse.q_type = _toggle_q_type_and_warn(parse.q_type, parse.q_type_run)
+            parse.state = QuestionFormatterState.ANSWER
+            self._answer_handler(parse, para, text)
+
+    def _choice_handler(
+        self, parse: _QuestionParse, para: Paragraph, text: str, matched: bool = False
+    ):
+        """Formats the next multiple choice option. If matched is True, the
+        paragraph is already known to start with a choice."""
+        if not (matched or CHOICES_RE.match(text)):
+            return
+
+        # well-formed choices already start with the expected letter, so the run
+        # only needs parsing and fixing up when it doesn't
+        if not (choice_run := para.runs[0]).text.startswith(
+            CHOICES[parse.current_choice]
+        ):
+            run_match = _validate_element_text(choice_run, pattern=CHOICES_RE)
+            _format_choice(run_match, choice_run, parse.current_choice)
+
+        # if current_choice was 0 and line_after_stem is true, we need to
+        # insert a blank line before the first choice
+        if parse.current_choice == 0 and self.line_after_stem:
+            para.insert_paragraph_before("")
+
+        # save text and update the choice we're looking for
+        parse.choices_para[parse.current_choice] = para
+        parse.current_choice += 1
+
+        if parse.current_choice == 4:
+            parse.state = QuestionFormatterState.ANSWER
+
+    def _answer_handler(self, parse: _QuestionParse, para: Paragraph, text: str):
+        """Formats the answer line."""
+        if not (answer_match := ANSWER_RE.match(text)):
+            return
+
+        para.insert_paragraph_before("")
+
+        if self.force_capitalize:
+            capitalize_paragraph(para)
+
+        if parse.q_type is QuestionType.MULTIPLE_CHOICE:
+            if answer_match.group(2) is None:
+                raise QuestionParserException(PARSE_ERROR_MSGS[ANSWER_RE])
+
+            try:
+                _format_answer_line(para, answer_match, parse.choices_para)
+            except QuestionParserException as ex:
+                logger.error(str(ex))
+
+        parse.state = QuestionFormatterState.DONE
+
+
+class EnumCellFormatter(CellFormatter):
+    """Formats a cell whose text must match a pattern that maps onto an Enum,
+    replacing the text with the canonical value of that Enum. Subclasses set the
+    pattern, the mapping from uppercased labels to values and the error message."""
+
+    pattern: re.Pattern
+    values: Dict[str, str]
+    error_msg: str
+
+    # a valid cell is cleared and rewritten, so preprocessing it would be thrown
+    # away. preprocess_format only cleans up the cells that fail to match
+    preprocess = False
+
+    def _lookup(self, text: str) -> Optional[str]:
+        """Returns the canonical value for a cell's text, or None if it has none."""
+        # cells usually hold just a label, which needs only a dict lookup
+        if (put := self.values.get(text.strip().upper())) is None and (
+            match := self.pattern.match(text)
+        ):
+            put = self.values[match.group(1).upper()]
+        return put
+
+    def preprocess_format(self, cell: _Cell) -> _Cell:
+        """Preprocesses cells that are about to be highlighted as errors, so they
+        are cleaned up like every other column, then formats the cell."""
+        if not cell_is_empty(cell) and self._lookup(cell.text) is None:
+            cell = preprocess_cell(cell)
+        return super().preprocess_format(cell)
 
-class TuBCellFormatter(CellFormatter):
     def format(self, cell: _Cell) -> _Cell:
-        if not (tub_match := TUB_RE.match(cell.text)):
+        put = self._lookup(cell.text)
+
+        if put is None:
             highlight_cell_text(cell, WD_COLOR_INDEX.RED)
-            logger.error("Question must be a toss-up, bonus, or visual bonus.")
+            logger.error(self.error_msg)
 
         else:
-            put = TossUpBonus.from_string(tub_match.group(1)).value
             clear_cell(cell)
-            tub_run = cell.paragraphs[0].runs[0]
-            tub_run.text = put
-            tub_run.italic = None
-            tub_run.bold = None
+            run = cell.paragraphs[0].runs[0]
+            run.text = put
+            run.italic = None
+            run.bold = None
             highlight_cell_text(cell, None)
 
         return cell
 
 
-class SubjectCellFormatter(CellFormatter):
-    def format(self, cell: _Cell) -> _Cell:
-        subject_match = SUBJECT_RE.match(cell.text)
+class TuBCellFormatter(EnumCellFormatter):
+    pattern = TUB_RE
+    values = TUB_VALUES
+    error_msg = "Question must be a toss-up, bonus, or visual bonus."
 
-        if subject_match:
-            put = Subject.from_string(subject_match.group(1)).value
-            clear_cell(cell)
-            subj_run = cell.paragraphs[0].runs[0]
-            subj_run.text = put
-            subj_run.italic = None
-            subj_run.bold = None
-            highlight_cell_text(cell, None)
-        # if a match can't be found, highlight the cell red
-        else:
-            highlight_cell_text(cell, WD_COLOR_INDEX.RED)
-            logger.error("Invalid subject.")
 
-        return cell
+class SubjectCellFormatter(EnumCellFormatter):
+    pattern = SUBJECT_RE
+    values = SUBJECT_VALUES
+    error_msg = "Invalid subject."
 
 
 class DifficultyFormatter(CellFormatter):
@@ -505,9 +600,9 @@ class DifficultyFormatter(CellFormatter):
     color = COL_COLORS["LOD"]
 
     def format(self, cell: _Cell) -> _Cell:
-        if cell.text:
+        if text := cell.text:
             try:
-                int(cell.text)
+                int(text)
             except ValueError:
                 highlight_cell_text(cell, WD_COLOR_INDEX.RED)
                 logger.error("LOD should be blank or an integer.")
@@ -533,27 +628,31 @@ class QLetterFormatter(CellFormatter):
     color = COL_COLORS["Q Letter"]
 
 
-def _format_question_type_run(q_type_run: Run, run_match: re.Match) -> QuestionType:
-    """Returns the type (Multiple Choice or Short Answer) of the question.
+def _format_question_type_run(
+    q_type_run: Run, run_match: re.Match
+) -> Tuple[QuestionType, Optional[Run]]:
+    """Returns the type (Multiple Choice or Short Answer) of the question, and the
+    run split off after the question type, if there was one.
 
     Also handles italicizing the run containing the question type."""
     _q_type = QuestionType.from_string(run_match.group(1))
     # if the run contains more than the question type, split
     # the run into two
-    if run_match.span()[1] < len(q_type_run.text):
-        q_type_run, _ = split_run_at(q_type_run, run_match.span()[1])
+    stem_run = None
+    if (q_type_end := run_match.end()) < len(run_match.string):
+        q_type_run, stem_run = split_run_at(q_type_run, q_type_end)
 
     q_type_run.text, q_type_run.italic = _q_type.value, True
-    return _q_type
+    return _q_type, stem_run
 
 
 def _format_answer_line(
-    para: Paragraph, test_choice_match: re.Match, choices: Dict[int, Paragraph]
+    para: Paragraph, answer_match: re.Match, choices: Dict[int, Paragraph]
 ):
-    choice_num = CHOICES.index(test_choice_match.group(1).upper() + ")")
+    choice_num = CHOICE_INDEX[answer_match.group(2).upper()]
     # if answer line is a single letter with an optional ), copy the
     # text of the correct choice over to the answer line
-    if test_choice_match.span()[1] <= test_choice_match.span(1)[1] + 1:
+    if answer_match.group(3) is None:
         correct_para = choices[choice_num]
         para.text = "ANSWER: "
         for run in correct_para.runs:
@@ -566,7 +665,7 @@ def _format_answer_line(
     else:
         if (
             choices[choice_num].text.upper()
-            != para.text.replace("ANSWER: ", "", 1).upper()
+            != answer_match.string[answer_match.start(2) :].upper()
         ):
             highlight_paragraph_text(para, WD_COLOR_INDEX.YELLOW)
             raise QuestionParserException("Answer line doesn't match choice.")
@@ -577,15 +676,8 @@ def _validate_element_text(
 ) -> re.Match:
     """If a recognized part of a question (question type, choices, etc.) is split across
     multiple runs, it won't parse."""
-
-    msgs = {
-        TEST_CHOICE_RE: "Found answer line, but couldn't find W, X, Y, or Z.",
-        CHOICES_RE: "Couldn't parse question. Check that choices are correct.",
-        Q_TYPE_RE: "Couldn't parse question. Check that question type is correct.",
-    }
-
     if not (run_match := pattern.match(run_or_para.text)):
-        raise QuestionParserException(msgs[pattern])
+        raise QuestionParserException(PARSE_ERROR_MSGS[pattern])
 
     return run_match
 
@@ -599,7 +691,7 @@ def _combine_qtype_and_stem_paragraphs(para: Paragraph) -> None:
     next_para_text = "".join(_r.text for _r in next_para if _r.text)
     # need to check if there even IS a stem - next paragraph shouldn't
     # start with W) or ANSWER:
-    if CHOICES_RE.match(next_para_text) or ANSWER_RE.match(next_para_text):
+    if STEM_END_RE.match(next_para_text):
         raise QuestionParserException("Couldn't parse question.")
 
     move_runs_to_end_of_para(next_para, para._p)
@@ -622,7 +714,9 @@ def _toggle_q_type_and_warn(q_type: QuestionType, q_type_run: Run) -> QuestionTy
 
 def _format_choice(run_match: re.Match, choice_run: Run, current_choice: int):
     """If the wrong choice was matched, replace it with the right choice."""
-    if run_match.group(1) != CHOICES[current_choice]:
-        choice_run.text = choice_run.text.replace(
-            run_match.group(1), CHOICES[current_choice], 1
-        )
+    if run_match.group(1) != (choice := CHOICES[current_choice]):
+        # the match was made against the run's text, so splice the right choice
+        # into it at the matched position
+        text = run_match.string
+        start, end = run_match.span(1)
+        choice_run.text = f"{text[:start]}{choice}{text[end:]}"
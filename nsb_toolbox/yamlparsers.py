@@ -1,5 +1,6 @@
 import collections.abc
 import itertools
+import string
 from copy import deepcopy
 from dataclasses import dataclass
 from functools import cached_property
@@ -76,6 +77,8 @@ class ParsedQuestionSpec:
     sets : np.ndarray[str]
     rounds : np.ndarray[str]
     qletters : np.ndarray[str]
+    packets : np.ndarray[str]
+        Unique set names with any "-A"/"-B" suffix removed.
 
     Methods
     -------
@@ -127,6 +130,10 @@ class ParsedQuestionSpec:
     def qletters(self) -> np.ndarray:
         return np.array([question.letter for question in self.question_list])
 
+    @cached_property
+    def packets(self) -> np.ndarray:
+        return np.unique([set_.split("-")[0] for set_ in self.sets])
+
     @cached_property
     def stats(self) -> Dict[str, int]:
         raw_values = np.array(
@@ -212,8 +219,10 @@ def generate_questions(
 
             template = set_config.Template[q_tub]
             difficulties = template.get("LOD")
-            subcategories = template.get("Subcategory", [None for e in difficulties])
-            q_letters = [chr(i) for i in range(ord("A"), ord("A") + len(difficulties))]
+            # only build the placeholder list when the template has no subcategories
+            if (subcategories := template.get("Subcategory")) is None:
+                subcategories = [None] * len(difficulties)
+            q_letters = list(string.ascii_uppercase[: len(difficulties)])
 
             if config.shuffle_difficulty:
                 config.rng.shuffle(difficulties)
@@ -224,16 +233,21 @@ def generate_questions(
             if config.shuffle_subcategory:
                 config.rng.shuffle(subcategories)
 
-            q_types = [None for e in difficulties]
-            q_types[np.argmax(q_letters)] = QuestionType.SHORT_ANSWER.value
+            q_types = [None] * len(difficulties)
+            q_types[q_letters.index(max(q_letters))] = QuestionType.SHORT_ANSWER
+
+            # these are the same for every question in the round, so they're
+            # resolved once rather than in each QuestionDetails.__post_init__
+            round_name = f"{set_config.Prefix}{round_num}"
+            tub = TossUpBonus.from_string(q_tub)
 
             for lod, subcat, q_type, q_letter in itertools.zip_longest(
                 difficulties, subcategories, q_types, q_letters, fillvalue=None
             ):
                 yield QuestionDetails(
                     set=set_name,
-                    round=f"{set_config.Prefix}{round_num}",
-                    tub=q_tub,
+                    round=round_name,
+                    tub=tub,
                     difficulty=lod,
                     letter=q_letter,
                     qtype=q_type,
@@ -2,7 +2,12 @@ from pathlib import Path
 
 import numpy as np
 import pytest
-from nsb_toolbox.assign import EditedQuestions
+from nsb_toolbox.assign import (
+    INVALID_ASSIGNMENT_COST,
+    EditedQuestions,
+    encode_categories,
+    solve_assignment,
+)
 from nsb_toolbox.importers import load_doc
 from nsb_toolbox.yamlparsers import ParsedQuestionSpec
 
@@ -170,6 +175,39 @@ class TestEditedQuestionsAssign:
         # check that each question in the spec was assigned
         assert len(assignments) == len(question_spec.question_list)
 
+    def test_seeded_assignment_is_stable(self, doc_path):
+        """A Random Seed fixes the generated assignment, so the tiebreaking noise
+        must keep being drawn the same way."""
+        question_spec = ParsedQuestionSpec.from_yaml_path(
+            data_dir / "test_assign_config.yaml"
+        )
+        question_spec.config.rng = np.random.default_rng(0)
+        questions = EditedQuestions.from_docx_path(doc_path)
+
+        questions.assign(question_spec)
+
+        assignments = [
+            f"{set_.text}-{rd.text}-{let.text}"
+            for set_, rd, let in zip(
+                questions.sets, questions.rounds, questions.qletters
+            )
+        ]
+        assert assignments == [
+            "HSR-A-RR1-A",
+            "HSR-B-RR1-A",
+            "HSR--",
+            "HSR--",
+            "HSR--",
+            "HSR-A-RR1-B",
+            "HSR-A-RR1-A",
+            "HSR-B-RR1-A",
+            "HSR-B-RR1-B",
+            "HSR-A-RR1-B",
+            "HSR--",
+            "HSR--",
+            "HSR-B-RR1-B",
+        ]
+
     def test_exception_when_assignment_failure(self, doc_path):
         questions = EditedQuestions.from_docx_path(doc_path)
 
@@ -244,3 +282,39 @@ class TestEditedQuestionsAssign:
             ValueError, match="There are not enough available questions"
         ):
             questions.assign(question_spec)
+
+
+class TestEncodeCategories:
+    """Tests the encode_categories helper."""
+
+    def test_shares_codebook(self):
+        questions = np.array(["HSR-A", "HSR-B", "", "HSR-A"])
+        spec = np.array(["HSR-B", "HSR-A", "HSR-C"])
+
+        q_codes, spec_codes = encode_categories(questions, spec)
+
+        assert q_codes.shape == questions.shape
+        assert spec_codes.shape == spec.shape
+        np.testing.assert_array_equal(
+            spec_codes != q_codes[:, np.newaxis], spec != questions[:, np.newaxis]
+        )
+
+
+class TestSolveAssignment:
+    """Tests the solve_assignment helper."""
+
+    def test_independent_blocks(self):
+        X = INVALID_ASSIGNMENT_COST
+        cost_matrix = np.array(
+            [
+                [1.0, 2.0, X, X],
+                [2.0, 1.0, X, X],
+                [X, X, 3.0, 1.0],
+                [X, X, 1.0, 3.0],
+                [X, X, X, X],
+            ]
+        )
+
+        q_assignments, slot_assignments = solve_assignment(cost_matrix)
+
+        assert dict(zip(slot_assignments, q_assignments)) == {0: 0, 1: 1, 2: 3, 3: 2}
@@ -0,0 +1,45 @@
+import pytest
+
+from nsb_toolbox.classes import QuestionType, Subject, TossUpBonus
+
+
+class TestFromString:
+    """Tests the from_string constructors of the label Enums."""
+
+    @pytest.mark.parametrize(
+        "label, expected",
+        [
+            ("TU", TossUpBonus.TOSS_UP),
+            ("Toss-up", TossUpBonus.TOSS_UP),
+            ("b", TossUpBonus.BONUS),
+            ("Visual Bonus", TossUpBonus.VISUAL_BONUS),
+        ],
+    )
+    def test_tub(self, label, expected):
+        assert TossUpBonus.from_string(label) is expected
+
+    @pytest.mark.parametrize(
+        "label, expected",
+        [
+            ("b", Subject.BIOLOGY),
+            ("Earth and Space", Subject.ESSC),
+            ("EN", Subject.ENERGY),
+        ],
+    )
+    def test_subject(self, label, expected):
+        assert Subject.from_string(label) is expected
+
+    @pytest.mark.parametrize(
+        "label, expected",
+        [
+            ("mc", QuestionType.MULTIPLE_CHOICE),
+            ("Short Answer", QuestionType.SHORT_ANSWER),
+        ],
+    )
+    def test_qtype(self, label, expected):
+        assert QuestionType.from_string(label) is expected
+
+    @pytest.mark.parametrize("enum_cls", [TossUpBonus, Subject, QuestionType])
+    def test_invalid_label(self, enum_cls):
+        with pytest.raises(ValueError):
+            enum_cls.from_string("nonsense")
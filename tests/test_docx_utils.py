@@ -1,5 +1,6 @@
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from docx import Document
 from nsb_toolbox import docx_utils
@@ -8,9 +9,10 @@ data_dir = Path(__file__).parent / "test_data"
 
 
 class TestPreprocessCell(unittest.TestCase):
-
-    test_data = Document(data_dir / "test_preprocess.docx")
-    temp_data = data_dir / "temp" / "temp_preprocess.docx"
+    @classmethod
+    def setUpClass(cls):
+        # parsed once for the class, and only if its tests are collected and run
+        cls.test_data = Document(data_dir / "test_preprocess.docx")
 
     def test_cell_1(self):
         """This cell contains only an uninterrupted run. It shouldn't be changed."""
@@ -120,4 +122,90 @@ class TestPreprocessCell(unittest.TestCase):
         self.assertEqual(expected, test)
 
     def test_save(self):
-        self.test_data.save(self.temp_data)
+        # write to a scratch directory rather than into the repository
+        with TemporaryDirectory() as temp_dir:
+            self.test_data.save(Path(temp_dir) / "temp_preprocess.docx")
+
+
+class TestCellIsEmpty(unittest.TestCase):
+    def test_whitespace_only(self):
+        cell = Document().add_table(rows=1, cols=1).cell(0, 0)
+        cell.paragraphs[0].add_run(" \t")
+        cell.add_paragraph("\xa0")
+        self.assertTrue(docx_utils.cell_is_empty(cell))
+
+    def test_with_text(self):
+        cell = Document().add_table(rows=1, cols=1).cell(0, 0)
+        cell.add_paragraph(" x ")
+        self.assertFalse(docx_utils.cell_is_empty(cell))
+
+
+class TestShadeCell(unittest.TestCase):
+    def test_reshading_replaces_fill(self):
+        cell = Document().add_table(rows=1, cols=1).cell(0, 0)
+        docx_utils.shade_cell(cell, "FFCC99")
+        docx_utils.shade_cell(cell, "e5dfec")
+
+        shds = cell._tc.xpath("./w:tcPr/w:shd")
+        self.assertEqual(len(shds), 1)
+        self.assertEqual(shds[0].get(docx_utils.qn("w:fill")), "e5dfec")
+
+    def test_reshading_drops_theme_attributes(self):
+        cell = Document().add_table(rows=1, cols=1).cell(0, 0)
+        shd = docx_utils.OxmlElement("w:shd")
+        for attr, value in {
+            "w:val": "clear",
+            "w:color": "auto",
+            "w:fill": "FFFFFF",
+            "w:themeFill": "accent1",
+            "w:themeFillTint": "33",
+        }.items():
+            shd.set(docx_utils.qn(attr), value)
+        cell._tc.get_or_add_tcPr().append(shd)
+
+        docx_utils.shade_cell(cell, "FFCC99")
+
+        shds = cell._tc.xpath("./w:tcPr/w:shd")
+        self.assertEqual(len(shds), 1)
+        self.assertEqual(dict(shds[0].attrib), {docx_utils.qn("w:fill"): "FFCC99"})
+
+
+class TestSetCellText(unittest.TestCase):
+    def setUp(self):
+        self.cell = Document().add_table(rows=1, cols=1).cell(0, 0)
+
+    def test_single_run_keeps_formatting(self):
+        run = self.cell.paragraphs[0].add_run("HSR")
+        run.bold = True
+
+        docx_utils.set_cell_text(self.cell, "HSR-A")
+
+        self.assertEqual(self.cell.text, "HSR-A")
+        self.assertEqual(len(self.cell.paragraphs[0].runs), 1)
+        self.assertTrue(self.cell.paragraphs[0].runs[0].bold)
+
+    def test_multiple_paragraphs_are_replaced(self):
+        self.cell.paragraphs[0].add_run("RR1")
+        self.cell.add_paragraph("RR2")
+
+        docx_utils.set_cell_text(self.cell, "RR3")
+
+        self.assertEqual(self.cell.text, "RR3")
+        self.assertEqual(len(self.cell.paragraphs), 1)
+
+
+class TestTableCells(unittest.TestCase):
+    def test_matches_table_cells(self):
+        table = Document(data_dir / "test_format.docx").tables[0]
+
+        fast = docx_utils.table_cells(table)
+
+        self.assertEqual([cell._tc for cell in fast], [c._tc for c in table._cells])
+
+    def test_merged_cells_fall_back(self):
+        table = Document().add_table(rows=2, cols=2)
+        table.cell(0, 0).merge(table.cell(1, 0))
+
+        fast = docx_utils.table_cells(table)
+
+        self.assertEqual([cell._tc for cell in fast], [c._tc for c in table._cells])
@@ -1,14 +1,32 @@
+from copy import deepcopy
 from pathlib import Path
 
+import numpy as np
 import pytest
 from docx import Document
 from docx.enum.text import WD_COLOR_INDEX
 from docx.shared import Pt
+from docx.table import Table
 from nsb_toolbox import tables
 
 data_dir = Path(__file__).parent / "test_data"
 
 
+def _fresh_table(doc):
+    """Returns a copy of the first table in doc. Formatters change cells in place,
+    so each test gets its own copy of a document that is only parsed once."""
+    table = doc.tables[0]
+    return Table(deepcopy(table._tbl), table._parent)
+
+
+def _extract_cell_text(cell):
+    """Returns the text of each run in each paragraph of cell, with [""] standing in
+    for a paragraph without runs."""
+    # read the run elements directly rather than wrapping every paragraph
+    # and run; CT_R.text is what Run.text returns
+    return [[r.text for r in p.r_lst] or [""] for p in cell._tc.p_lst]
+
+
 init_table_sizes = (0, 30, 60)
 init_table_subj = (None, "Chemistry", "Earth and Space")
 init_table_set = (None, "HSR", "MSN")
@@ -48,55 +66,62 @@ class TestInitialize:
         assert generated_rows == expected_rows + 1
 
     def test_cell_widths(self, table_cells):
-        for idx, cell in enumerate(table_cells):
-            row_idx, col_idx = divmod(idx, 13)
-
-            assert pytest.approx(cell.width.inches, 0.001) == tables.COL_WIDTHS[col_idx]
+        widths = np.array([cell.width.inches for cell in table_cells]).reshape(-1, 13)
+        np.testing.assert_allclose(
+            widths, np.broadcast_to(tables.COL_WIDTHS, widths.shape), rtol=0.001
+        )
 
     def test_cell_optional_parameters(self, table_cells, initialize_params):
         _, subj, set_, author = initialize_params
 
-        for idx, cell in enumerate(table_cells):
-            row_idx, col_idx = divmod(idx, 13)
-
-            if col_idx == 1 and row_idx > 0 and subj:
-                assert cell.text == subj
+        # only the body cells of the filled columns need checking
+        for col_idx, expected in ((1, subj), (5, set_), (8, author)):
+            if expected:
+                for cell in table_cells[13 + col_idx :: 13]:
+                    assert cell.text == expected
 
-            if col_idx == 5 and row_idx > 0 and set_:
-                assert cell.text == set_
 
-            if col_idx == 8 and row_idx > 0 and author:
-                assert cell.text == author
+@pytest.fixture(scope="module")
+def tub_test_doc():
+    return Document(data_dir / "test_TUB.docx")
 
 
 @pytest.fixture
-def tub_test_doc():
-    return Document(data_dir / "test_TUB.docx")
+def tub_test_table(tub_test_doc):
+    return _fresh_table(tub_test_doc)
+
+
+@pytest.fixture(scope="module")
+def tub_formatter():
+    return tables.TuBCellFormatter()
 
 
 @pytest.mark.parametrize("row_idx", [0, 1, 2], ids=["TOSS-UP", "BONUS", "VISUAL BONUS"])
 class TestTUBCellFormatter:
-    def test_formatted_text(self, tub_test_doc, row_idx):
+    def test_formatted_text(self, tub_test_table, tub_formatter, row_idx):
         expected_text = ["TOSS-UP", "BONUS", "VISUAL BONUS"]
-        row = tub_test_doc.tables[0].rows[row_idx]
+        row = tub_test_table.rows[row_idx]
         for cell in row.cells:
-            formatted_cell = tables.TuBCellFormatter().format(cell)
+            formatted_cell = tub_formatter.format(cell)
             assert formatted_cell.text == expected_text[row_idx]
 
     def test_cell_has_single_paragraph(
         self,
-        tub_test_doc,
+        tub_test_table,
+        tub_formatter,
         row_idx,
     ):
-        row = tub_test_doc.tables[0].rows[row_idx]
+        row = tub_test_table.rows[row_idx]
         for cell in row.cells:
-            formatted_cell = tables.TuBCellFormatter().format(cell)
+            formatted_cell = tub_formatter.format(cell)
             assert len(formatted_cell.paragraphs) == 1
 
-    def test_paragraph_contains_one_run_with_normal_text(self, tub_test_doc, row_idx):
-        row = tub_test_doc.tables[0].rows[row_idx]
+    def test_paragraph_contains_one_run_with_normal_text(
+        self, tub_test_table, tub_formatter, row_idx
+    ):
+        row = tub_test_table.rows[row_idx]
         for cell in row.cells:
-            formatted_cell = tables.TuBCellFormatter().format(cell)
+            formatted_cell = tub_formatter.format(cell)
             cell_runs = formatted_cell.paragraphs[0].runs
             assert len(cell_runs) == 1
             assert cell_runs[0].font.italic is None
@@ -104,54 +129,78 @@ class TestTUBCellFormatter:
 
 
 class TestTUBCellFormatterErrors:
-    def test_unrecognizable_cell_text_is_unchanged(self, tub_test_doc):
-        row = tub_test_doc.tables[0].rows[3]
+    def test_unrecognizable_cell_text_is_unchanged(self, tub_test_table, tub_formatter):
+        row = tub_test_table.rows[3]
         for cell in row.cells:
             prior_text = cell.text
-            formatted_cell = tables.TuBCellFormatter().format(cell)
+            formatted_cell = tub_formatter.format(cell)
             after_text = formatted_cell.text
             assert prior_text == after_text
 
-    def test_unrecognizable_cell_is_highlighted(self, tub_test_doc):
-        row = tub_test_doc.tables[0].rows[3]
+    def test_unrecognizable_cell_is_highlighted(self, tub_test_table, tub_formatter):
+        row = tub_test_table.rows[3]
         for cell in row.cells:
-            formatted_cell = tables.TuBCellFormatter().format(cell)
+            formatted_cell = tub_formatter.format(cell)
             run = formatted_cell.paragraphs[0].runs[0]
             assert run.font.highlight_color == WD_COLOR_INDEX.RED
 
+    def test_unrecognizable_cell_is_preprocessed(self, tub_formatter):
+        cell = Document().add_table(rows=1, cols=1).cell(0, 0)
+        cell.paragraphs[0].add_run(" \xa0TOSS\xa0BONUS\n ")
+        cell.add_paragraph("")
+
+        formatted_cell = tub_formatter.preprocess_format(cell)
+
+        assert [para.text for para in formatted_cell.paragraphs] == ["TOSS BONUS"]
+        run = formatted_cell.paragraphs[0].runs[0]
+        assert run.font.highlight_color == WD_COLOR_INDEX.RED
+
+
+@pytest.fixture(scope="module")
+def difficulty_test_doc():
+    return Document(data_dir / "test_LOD.docx")
+
 
 @pytest.fixture
-def format_difficulty_rows():
-    test_data = Document(data_dir / "test_LOD.docx")
-    return test_data.tables[0].rows
+def format_difficulty_rows(difficulty_test_doc):
+    return _fresh_table(difficulty_test_doc).rows
+
+
+@pytest.fixture(scope="module")
+def difficulty_formatter():
+    return tables.DifficultyFormatter()
 
 
-@pytest.mark.parametrize("cell_idx", [0, 1, 2, 3])
 class TestDifficultyFormatter:
-    def test_expected_test(self, format_difficulty_rows, cell_idx):
-        EXPECTED_TEXT = (
-            "1",
-            "2",
-            "3",
-            "",
-        )
-        cell = format_difficulty_rows[0].cells[cell_idx]
-        formatter = tables.DifficultyFormatter()
-        assert formatter.format(cell).text == EXPECTED_TEXT[cell_idx]
-
-    def test_difficulty_errors(self, format_difficulty_rows, cell_idx):
-        cell = format_difficulty_rows[1].cells[cell_idx]
-        formatter = tables.DifficultyFormatter()
-        test_cell = formatter.format(cell)
-        assert (
-            test_cell.paragraphs[0].runs[0].font.highlight_color == WD_COLOR_INDEX.RED
-        )
+    def test_expected_test(self, format_difficulty_rows, difficulty_formatter):
+        expected_text = ["1", "2", "3", ""]
+        row = format_difficulty_rows[0]
+        for cell, expected in zip(row.cells, expected_text):
+            assert difficulty_formatter.format(cell).text == expected
+
+    def test_difficulty_errors(self, format_difficulty_rows, difficulty_formatter):
+        row = format_difficulty_rows[1]
+        for cell in row.cells:
+            test_cell = difficulty_formatter.format(cell)
+            assert (
+                test_cell.paragraphs[0].runs[0].font.highlight_color
+                == WD_COLOR_INDEX.RED
+            )
+
+
+@pytest.fixture(scope="module")
+def subject_test_doc():
+    return Document(data_dir / "test_subject.docx")
 
 
 @pytest.fixture
-def format_subject_rows():
-    test_data = Document(data_dir / "test_subject.docx")
-    return test_data.tables[0].rows
+def format_subject_rows(subject_test_doc):
+    return _fresh_table(subject_test_doc).rows
+
+
+@pytest.fixture(scope="module")
+def subject_formatter():
+    return tables.SubjectCellFormatter()
 
 
 @pytest.mark.parametrize(
@@ -166,18 +215,10 @@ def format_subject_rows():
         "Energy",
     ],
 )
-@pytest.mark.parametrize(
-    "cell_idx",
-    [0, 1, 2, 3],
-    ids=[
-        "Full Correct",
-        "Abbreviated",
-        "Abbreviated Wrong Format",
-        "Full Wrong Format",
-    ],
-)
 class TestFormatSubject:
-    def test_expected_text(self, format_subject_rows, row_idx, cell_idx):
+    # each row spells its subject four ways: full and correct, abbreviated,
+    # abbreviated in the wrong format, and full in the wrong format
+    def test_expected_text(self, format_subject_rows, subject_formatter, row_idx):
         EXPECTED_TEXT = (
             "Biology",
             "Chemistry",
@@ -186,19 +227,16 @@ class TestFormatSubject:
             "Math",
             "Energy",
         )
-        cell = format_subject_rows[row_idx].cells[cell_idx]
-        formatter = tables.SubjectCellFormatter()
-        assert formatter.format(cell).text == EXPECTED_TEXT[row_idx]
-
-    def test_cell_formatting(self, format_subject_rows, row_idx, cell_idx):
-        cell = format_subject_rows[row_idx].cells[cell_idx]
-        formatter = tables.SubjectCellFormatter()
+        for cell in format_subject_rows[row_idx].cells:
+            assert subject_formatter.format(cell).text == EXPECTED_TEXT[row_idx]
 
-        formatted_cell = formatter.format(cell)
-        assert len(formatted_cell.paragraphs) == 1
-        assert len(formatted_cell.paragraphs[0].runs) == 1
-        assert formatted_cell.paragraphs[0].runs[0].font.italic is None
-        assert formatted_cell.paragraphs[0].runs[0].font.bold is None
+    def test_cell_formatting(self, format_subject_rows, subject_formatter, row_idx):
+        for cell in format_subject_rows[row_idx].cells:
+            formatted_cell = subject_formatter.format(cell)
+            assert len(formatted_cell.paragraphs) == 1
+            assert len(formatted_cell.paragraphs[0].runs) == 1
+            assert formatted_cell.paragraphs[0].runs[0].font.italic is None
+            assert formatted_cell.paragraphs[0].runs[0].font.bold is None
 
 
 @pytest.mark.parametrize(
@@ -212,21 +250,76 @@ class TestFormatSubject:
     ],
 )
 class TestFormatSubjectErrors:
-    def test_errors(self, format_subject_rows, cell_idx):
+    def test_errors(self, format_subject_rows, subject_formatter, cell_idx):
         cell = format_subject_rows[6].cells[cell_idx]
 
         prior_text = cell.text
-        sformatter = tables.SubjectCellFormatter()
-        test_run = sformatter.format(cell).paragraphs[0].runs[0]
+        test_run = subject_formatter.format(cell).paragraphs[0].runs[0]
         after_text = cell.text
         assert prior_text == after_text
         assert test_run.font.highlight_color == WD_COLOR_INDEX.RED
 
 
+# runs in each paragraph of the formatted question cells, keyed by force_capitalize
+question_expected_sa = {
+    True: [
+        ["Short Answer", "    This is a well-formatted question."],
+        [""],
+        ["ANSWER: IT SHOULD BE UNCHANGED"],
+    ],
+    False: [
+        ["Short Answer", "    This is a well-formatted question."],
+        [""],
+        ["ANSWER: it should be unchanged"],
+    ],
+}
+question_expected_sa_line_break = {
+    True: [
+        ["Short Answer", "    This is a well-formatted question that is"],
+        ["split across multiple lines on purpose"],
+        [""],
+        ["ANSWER: IT SHOULD BE UNCHANGED"],
+    ],
+    False: [
+        ["Short Answer", "    This is a well-formatted question that is"],
+        ["split across multiple lines on purpose"],
+        [""],
+        ["ANSWER: it should be unchanged"],
+    ],
+}
+_mc_stem_and_choices = [
+    ["Multiple Choice", "    This is a well-formatted question."],
+    ["W) This is the W) choice"],
+    ["X) This is the X) choice"],
+    ["Y) This is the Y) choice"],
+]
+_mc_answers = {
+    True: [[""], ["ANSWER: W) THIS IS THE W) CHOICE"]],
+    False: [[""], ["ANSWER: W) this is the w) choice"]],
+}
+question_expected_mc = {
+    capitalize: _mc_stem_and_choices + [["Z) This is the Z) choice"]] + answer
+    for capitalize, answer in _mc_answers.items()
+}
+question_expected_mc_line_break = {
+    capitalize: _mc_stem_and_choices
+    + [
+        ["Z) This is the Z) choice and it is"],
+        ["split across multiple lines on purpose"],
+    ]
+    + answer
+    for capitalize, answer in _mc_answers.items()
+}
+
+
+@pytest.fixture(scope="module")
+def question_test_doc():
+    return Document(data_dir / "test_question_parser.docx")
+
+
 @pytest.fixture
-def format_question_rows():
-    test_data = Document(data_dir / "test_question_parser.docx")
-    return test_data.tables[0].rows
+def format_question_rows(question_test_doc):
+    return _fresh_table(question_test_doc).rows
 
 
 @pytest.mark.parametrize(
@@ -242,39 +335,18 @@ def format_question_rows():
     ],
 )
 class TestQuestionFormat:
-    def _extract_cell_text(self, cell):
-        ret = []
-        for para in cell.paragraphs:
-            if para.runs == []:
-                ret.append([""])
-            else:
-                ret.append([run.text for run in para.runs])
-
-        return ret
-
     @pytest.mark.parametrize(
         "force_capitalize", [True, False], ids=["+capitalize", "-capitalize"]
     )
     def test_short_answer(self, format_question_rows, cell_idx, force_capitalize):
         """This makes sure that recognizable Short Answer questions
         are properly formatted."""
-        if force_capitalize:
-            expected = [
-                ["Short Answer", "    This is a well-formatted question."],
-                [""],
-                ["ANSWER: IT SHOULD BE UNCHANGED"],
-            ]
-        else:
-            expected = [
-                ["Short Answer", "    This is a well-formatted question."],
-                [""],
-                ["ANSWER: it should be unchanged"],
-            ]
+        expected = question_expected_sa[force_capitalize]
 
         cell = format_question_rows[0].cells[cell_idx]
 
         q_parser = tables.QuestionCellFormatter(force_capitalize=force_capitalize)
-        test_text = self._extract_cell_text(q_parser.preprocess_format(cell))
+        test_text = _extract_cell_text(q_parser.preprocess_format(cell))
         assert test_text == expected
         assert cell.paragraphs[-1].runs[0].font.highlight_color is None
 
@@ -286,51 +358,61 @@ class TestQuestionFormat:
     ):
         """This makes sure that recognizable Short Answer questions
         are properly formatted."""
-        if force_capitalize:
-            expected = [
-                ["Multiple Choice", "    This is a well-formatted question."],
-                ["W) This is the W) choice"],
-                ["X) This is the X) choice"],
-                ["Y) This is the Y) choice"],
-                ["Z) This is the Z) choice"],
-                [""],
-                ["ANSWER: W) THIS IS THE W) CHOICE"],
-            ]
-        else:
-            expected = [
-                ["Multiple Choice", "    This is a well-formatted question."],
-                ["W) This is the W) choice"],
-                ["X) This is the X) choice"],
-                ["Y) This is the Y) choice"],
-                ["Z) This is the Z) choice"],
-                [""],
-                ["ANSWER: W) this is the w) choice"],
-            ]
+        expected = question_expected_mc[force_capitalize]
 
         cell = format_question_rows[1].cells[cell_idx]
 
         q_parser = tables.QuestionCellFormatter(force_capitalize=force_capitalize)
-        test_text = self._extract_cell_text(q_parser.preprocess_format(cell))
+        test_text = _extract_cell_text(q_parser.preprocess_format(cell))
         assert test_text == expected
         assert cell.paragraphs[-1].runs[0].font.highlight_color is None
 
     def test_multiple_choice_fill_answer(self, format_question_rows, cell_idx):
         """This makes sure that recognizable Short Answer questions
         are properly formatted."""
-        expected = [
-            ["Multiple Choice", "    This is a well-formatted question."],
-            ["W) This is the W) choice"],
-            ["X) This is the X) choice"],
-            ["Y) This is the Y) choice"],
-            ["Z) This is the Z) choice"],
-            [""],
-            ["ANSWER: W) THIS IS THE W) CHOICE"],
-        ]
+        expected = question_expected_mc[True]
 
         cell = format_question_rows[2].cells[cell_idx]
 
         q_parser = tables.QuestionCellFormatter()
-        test_text = self._extract_cell_text(q_parser.preprocess_format(cell))
+        test_text = _extract_cell_text(q_parser.preprocess_format(cell))
+        assert test_text == expected
+        assert cell.paragraphs[-1].runs[0].font.highlight_color is None
+
+    @pytest.mark.parametrize(
+        "answer_line, force_capitalize, expected",
+        [
+            ("ANSWER: W", False, question_expected_mc[True]),
+            ("answer: W", False, question_expected_mc[True]),
+            ("ANSWER:W", False, question_expected_mc[True]),
+            ("ANSWER: W) this is the w) choice", False, question_expected_mc[False]),
+            ("answer: W) this is the w) choice", True, question_expected_mc[True]),
+            (
+                "ANSWER:W) this is the w) choice",
+                True,
+                question_expected_mc[True][:-1] + [["ANSWER:W) THIS IS THE W) CHOICE"]],
+            ),
+        ],
+        ids=[
+            "Letter",
+            "Lowercase letter",
+            "Letter without space",
+            "Choice text",
+            "Lowercase choice text",
+            "Choice text without space",
+        ],
+    )
+    def test_multiple_choice_answer_line_forms(
+        self, format_question_rows, cell_idx, answer_line, force_capitalize, expected
+    ):
+        """Answer lines are linked to their choice whether they give just the
+        letter or the choice's text, regardless of case or a space after the
+        colon. An answer line that gives the choice's text is left as written."""
+        cell = format_question_rows[2].cells[cell_idx]
+        cell.paragraphs[-1].text = answer_line
+
+        q_parser = tables.QuestionCellFormatter(force_capitalize=force_capitalize)
+        test_text = _extract_cell_text(q_parser.preprocess_format(cell))
         assert test_text == expected
         assert cell.paragraphs[-1].runs[0].font.highlight_color is None
 
@@ -342,25 +424,12 @@ class TestQuestionFormat:
     ):
         """This makes sure that recognizable Short Answer questions
         are properly formatted."""
-        if force_capitalize:
-            expected = [
-                ["Short Answer", "    This is a well-formatted question that is"],
-                ["split across multiple lines on purpose"],
-                [""],
-                ["ANSWER: IT SHOULD BE UNCHANGED"],
-            ]
-        else:
-            expected = [
-                ["Short Answer", "    This is a well-formatted question that is"],
-                ["split across multiple lines on purpose"],
-                [""],
-                ["ANSWER: it should be unchanged"],
-            ]
+        expected = question_expected_sa_line_break[force_capitalize]
 
         cell = format_question_rows[3].cells[cell_idx]
 
         q_parser = tables.QuestionCellFormatter(force_capitalize=force_capitalize)
-        test_text = self._extract_cell_text(q_parser.preprocess_format(cell))
+        test_text = _extract_cell_text(q_parser.preprocess_format(cell))
         assert test_text == expected
         assert cell.paragraphs[-1].runs[0].font.highlight_color is None
 
@@ -372,33 +441,12 @@ class TestQuestionFormat:
     ):
         """This makes sure that recognizable Short Answer questions
         are properly formatted."""
-        if force_capitalize:
-            expected = [
-                ["Multiple Choice", "    This is a well-formatted question."],
-                ["W) This is the W) choice"],
-                ["X) This is the X) choice"],
-                ["Y) This is the Y) choice"],
-                ["Z) This is the Z) choice and it is"],
-                ["split across multiple lines on purpose"],
-                [""],
-                ["ANSWER: W) THIS IS THE W) CHOICE"],
-            ]
-        else:
-            expected = [
-                ["Multiple Choice", "    This is a well-formatted question."],
-                ["W) This is the W) choice"],
-                ["X) This is the X) choice"],
-                ["Y) This is the Y) choice"],
-                ["Z) This is the Z) choice and it is"],
-                ["split across multiple lines on purpose"],
-                [""],
-                ["ANSWER: W) this is the w) choice"],
-            ]
+        expected = question_expected_mc_line_break[force_capitalize]
 
         cell = format_question_rows[4].cells[cell_idx]
 
         q_parser = tables.QuestionCellFormatter(force_capitalize=force_capitalize)
-        test_text = self._extract_cell_text(q_parser.preprocess_format(cell))
+        test_text = _extract_cell_text(q_parser.preprocess_format(cell))
         assert test_text == expected
         assert cell.paragraphs[-1].runs[0].font.highlight_color is None
 
@@ -468,6 +516,46 @@ class TestQuestionFormatterErrors:
             test_cell.paragraphs[-1].runs[0].font.highlight_color == WD_COLOR_INDEX.RED
         )
 
+    @pytest.mark.parametrize(
+        "cell_idx",
+        [0, 3, 4],
+        ids=[
+            "MC without 4 choices",
+            "Choice split across multiple runs",
+            "Answer choice doesn't match available choices",
+        ],
+    )
+    def test_formatter_reused_after_error(self, format_question_rows, cell_idx):
+        """A cell that fails mid-parse leaves no state behind for the next cell."""
+        q_parser = tables.QuestionCellFormatter()
+        q_parser.preprocess_format(format_question_rows[7].cells[cell_idx])
+
+        cell = format_question_rows[1].cells[0]
+        test_text = _extract_cell_text(q_parser.preprocess_format(cell))
+        assert test_text == question_expected_mc[False]
+        assert cell.paragraphs[-1].runs[0].font.highlight_color is None
+
+
+# expected text of the first four columns of test_format.docx after formatting
+format_expected_tub = ("TUB", "TOSS-UP", "BONUS", "TOSS-UP", "BONUS", "TOSS-UP")
+format_expected_subj = (
+    "Subj",
+    "Chemistry",
+    "Biology",
+    "Earth and Space",
+    "Energy",
+    "Physics",
+)
+format_expected_ques = (
+    "Ques",
+    "Short Answer    Question\n\nANSWER: answer",
+    "Short Answer    Question\n\nANSWER: ANSWER",
+    "Multiple Choice    Question\nW) w\nX) x\nY) y\nZ) z\n\nANSWER: Z) z",
+    "Multiple Choice    Question\nW) w\nX) x\nY) y\nZ) z\n\nANSWER: Z) Z",
+    "Multiple Choice    Question\nW) w\nX) x\nY) y\nZ) z\n\nANSWER: Z) Z",
+)
+format_expected_lod = ("LOD", "1", "2", "3", "4", "")
+
 
 @pytest.fixture(scope="module")
 def format_test_table():
@@ -478,70 +566,68 @@ def format_test_table():
     return doc.tables[0]
 
 
+@pytest.fixture(scope="module")
+def format_test_texts(format_test_table):
+    """Text of every cell in the formatted table, as a list per column. The column
+    tests only read the table, so it's walked once instead of once per test."""
+    cells = format_test_table._cells
+    col_count = format_test_table._column_count
+    return [[cell.text for cell in cells[idx::col_count]] for idx in range(col_count)]
+
+
+@pytest.fixture(scope="module")
+def normal_font(format_test_table):
+    return format_test_table.part.styles["Normal"].font
+
+
+class TestFormatStyle:
+    def test_font_name(self, normal_font):
+        assert normal_font.name == "Times New Roman"
+
+    def test_font_size(self, normal_font):
+        assert normal_font.size == Pt(12)
+
+
 @pytest.mark.parametrize(
     "cell_idx",
     [0, 1, 2, 3, 4, 5],
-    ids={
+    ids=[
         "Header",
         "Question 1",
         "Question 2",
         "Question 3",
         "Question 4",
         "Question 5",
-    },
+    ],
 )
 class TestFormat:
-    def test_font_name(self, format_test_table, cell_idx):
-        assert format_test_table.part.styles["Normal"].font.name == "Times New Roman"
+    def test_tub_col(self, format_test_texts, cell_idx):
+        assert format_test_texts[0][cell_idx] == format_expected_tub[cell_idx]
 
-    def test_font_size(self, format_test_table, cell_idx):
-        assert format_test_table.part.styles["Normal"].font.size == Pt(12)
+    def test_subj_col(self, format_test_texts, cell_idx):
+        assert format_test_texts[1][cell_idx] == format_expected_subj[cell_idx]
 
-    def test_tub_col(self, format_test_table, cell_idx):
-        expected = ["TUB", "TOSS-UP", "BONUS", "TOSS-UP", "BONUS", "TOSS-UP"]
-        expected_text = expected[cell_idx]
+    def test_ques_col(self, format_test_texts, cell_idx):
+        assert format_test_texts[2][cell_idx] == format_expected_ques[cell_idx]
 
-        assert format_test_table.columns[0].cells[cell_idx].text == expected_text
+    def test_lod_col(self, format_test_texts, cell_idx):
+        assert format_test_texts[3][cell_idx] == format_expected_lod[cell_idx]
 
-    def test_subj_col(self, format_test_table, cell_idx):
-        expected = [
-            "Subj",
-            "Chemistry",
-            "Biology",
-            "Earth and Space",
-            "Energy",
-            "Physics",
-        ]
-        expected_text = expected[cell_idx]
-
-        assert format_test_table.columns[1].cells[cell_idx].text == expected_text
-
-    def test_ques_col(self, format_test_table, cell_idx):
-        expected = [
-            "Ques",
-            "Short Answer    Question\n\nANSWER: answer",
-            "Short Answer    Question\n\nANSWER: ANSWER",
-            "Multiple Choice    Question\nW) w\nX) x\nY) y\nZ) z\n\nANSWER: Z) z",
-            "Multiple Choice    Question\nW) w\nX) x\nY) y\nZ) z\n\nANSWER: Z) Z",
-            "Multiple Choice    Question\nW) w\nX) x\nY) y\nZ) z\n\nANSWER: Z) Z",
-        ]
-
-        expected_text = expected[cell_idx]
-
-        assert format_test_table.columns[2].cells[cell_idx].text == expected_text
-
-    def test_lod_col(self, format_test_table, cell_idx):
-        expected = [
-            "LOD",
-            "1",
-            "2",
-            "3",
-            "4",
-            "",
-        ]
-        expected_text = expected[cell_idx]
-
-        assert format_test_table.columns[3].cells[cell_idx].text == expected_text
+
+def test_format_rejects_narrow_table():
+    doc = Document(data_dir / "test_TUB.docx")
+    with pytest.raises(ValueError, match="must have at least 13 columns, found 6"):
+        tables.RawQuestions(doc).format(verbose=False)
+
+
+def test_format_accepts_wide_table():
+    doc = Document(data_dir / "test_format.docx")
+    doc.tables[0].add_column(Pt(36))
+
+    tables.RawQuestions(doc).format(verbose=False)
+
+    texts = [cell.text for cell in doc.tables[0].columns[0].cells]
+    assert tuple(texts) == format_expected_tub
 
 
 @pytest.fixture(scope="module")
@@ -15,8 +15,10 @@ data_dir = Path(__file__).parent / "test_data"
 
 
 class TestParsedQuestionSpec(TestCase):
-    def setUp(self):
-        self.instance = ParsedQuestionSpec.from_yaml_path(
+    @classmethod
+    def setUpClass(cls):
+        # the field tests only read the spec, so it's parsed once for the class
+        cls.instance = ParsedQuestionSpec.from_yaml_path(
             data_dir / "test_assign_config.yaml"
         )
 
@@ -120,16 +122,21 @@ class TestParsedQuestionSpec(TestCase):
         expected = np.array(["A", "B"] * 4)
         assert_equal(self.instance.qletters, expected)
 
+    def test_packets_field(self):
+        expected = np.array(["HSR"])
+        assert_equal(self.instance.packets, expected)
+
 
 class TestParseSets(TestCase):
+    # parse_sets copies the templates it uses, so every test can share these
+    round_definitions = {"RoundRobin": {"TU": {"LOD": [1, 1, 1, 1]}}}
+
     def test_simple_template(self):
 
         set_config = [
             {"Set": "HSR", "Rounds": 1, "Prefix": "RR", "Template": "RoundRobin"}
         ]
-        round_definitions = {"RoundRobin": {"TU": {"LOD": [1, 1, 1, 1]}}}
-
-        generated = parse_sets(set_config, round_definitions)
+        generated = parse_sets(set_config, self.round_definitions)
         expected = [
             SetConfig(
                 **{
@@ -153,9 +160,7 @@ class TestParseSets(TestCase):
                 "Template": {"from": "RoundRobin", "add": {"TU": {"LOD": [1]}}},
             }
         ]
-        round_definitions = {"RoundRobin": {"TU": {"LOD": [1, 1, 1, 1]}}}
-
-        generated = parse_sets(set_config, round_definitions)
+        generated = parse_sets(set_config, self.round_definitions)
         expected = [
             SetConfig(
                 **{
@@ -168,6 +173,10 @@ class TestParseSets(TestCase):
         ]
 
         self.assertEqual(generated, expected)
+        # adding to a template must not change the shared definition
+        self.assertEqual(
+            self.round_definitions, {"RoundRobin": {"TU": {"LOD": [1, 1, 1, 1]}}}
+        )
 
     def test_malformed(self):
 
@@ -179,8 +188,6 @@ class TestParseSets(TestCase):
                 "Template": {"add": {"TU": {"LOD": [1]}}},
             }
         ]
-        round_definitions = {"RoundRobin": {"TU": {"LOD": [1, 1, 1, 1]}}}
-
         with self.assertRaises(KeyError) as ex:
-            parse_sets(set_config, round_definitions)
+            parse_sets(set_config, self.round_definitions)
         self.assertIn("If Template is a dictionary, it should", str(ex.exception))